@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 21:03:18
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 21:03:18
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import re
+import hashlib
+import threading
+import http.server
+
+import pytest
+
+
+class FileRequestHandler(http.server.BaseHTTPRequestHandler):
+    r"""Serves the in-memory files of the server, with ETag/Last-Modified validators, conditional requests and single Range requests."""
+    last_modified = 'Mon, 19 Oct 2026 00:00:00 GMT'
+
+    def do_GET(self):
+        content = self.server.files.get(self.path, None)
+        if content is None:
+            return self.reply(404)
+
+        etag = f'"{hashlib.sha1(content).hexdigest()[:16]}"'
+        validators = {'ETag': etag, 'Last-Modified': self.last_modified}
+        if self.headers.get('If-None-Match', None) == etag:
+            return self.reply(304, headers=validators)
+
+        byte_range = re.fullmatch(r'bytes=(\d+)-', self.headers.get('Range', ''))
+        if byte_range is not None and self.headers.get('If-Range', etag) == etag:
+            start = int(byte_range.group(1))
+            if len(content) <= start:
+                return self.reply(416, headers={'Content-Range': f'bytes */{len(content)}'})
+            return self.reply(206, content[start:], headers={**validators, 'Content-Range': f'bytes {start}-{len(content) - 1}/{len(content)}'})
+
+        return self.reply(200, content, headers=validators)
+
+    def reply(self, status: int, content: bytes = b'', headers: dict | None = None):
+        self.server.requests.append(dict(path=self.path, headers=dict(self.headers), status=status))
+        self.send_response(status)
+        for name, value in (headers or dict()).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    r"""A local HTTP server, files are served from 'server.files' (path -> bytes) and every request is recorded into 'server.requests'."""
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), FileRequestHandler)
+    server.files = dict()
+    server.requests = list()
+    server.url = f'http://127.0.0.1:{server.server_address[1]}'
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
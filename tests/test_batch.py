@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 21:44:05
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 21:44:05
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import os
+import json
+import time
+import pytest
+
+from younger.commons.batch import analyze_readmes, process_pool_imap
+from younger.commons.string import scan_readme_string
+
+
+def run_task(argument: str) -> str:
+    if argument == 'raise':
+        raise KeyError('bad task')
+    if argument == 'crash':
+        os._exit(3)
+    if argument == 'hang':
+        time.sleep(60)
+    return argument.upper()
+
+
+def test_process_pool_imap():
+    arguments = ['a', 'raise', 'b', 'crash', 'c', 'hang', 'd']
+    start_time = time.monotonic()
+    results = {key: (status, result) for key, status, result in process_pool_imap(run_task, enumerate(arguments), worker_number=2, timeout=2)}
+    assert time.monotonic() - start_time < 30
+
+    assert [results[key] for key in (0, 2, 4, 6)] == [('ok', 'A'), ('ok', 'B'), ('ok', 'C'), ('ok', 'D')]
+    assert results[1][0] == 'error' and 'KeyError' in results[1][1]
+    assert results[3] == ('error', 'Worker Process Exited With Code 3.')
+    assert results[5] == ('timeout', None)
+
+
+def test_analyze_readmes(tmp_path):
+    readmes = [('a', '| A | B |\n|---|---|\n| 1 | 2 |\n'), ('b', 'Trained on 2024-12-27 for 10 epochs.'), ('c', None)]
+    extractors = ('tables', 'dates')
+
+    statistics = analyze_readmes(readmes, tmp_path.joinpath('results.jsonl'), extractors=extractors, worker_number=2, cache_filepath=tmp_path.joinpath('cache.db'))
+    assert statistics == dict(ok=2, error=1, timeout=0, cached=0)
+    with open(tmp_path.joinpath('results.jsonl'), 'r', encoding='utf-8') as file:
+        records = {record['id']: record for record in map(json.loads, file)}
+    assert records['a'] == dict(id='a', status='ok', results=json.loads(json.dumps(scan_readme_string(readmes[0][1], extractors=extractors))))
+    assert records['b']['results']['dates'] == ['2024-12-27']
+    assert records['c'] == dict(id='c', status='error', error='README Is Not A String But \'NoneType\'.')
+
+    # Unchanged READMEs are served from the cache on reruns.
+    statistics = analyze_readmes(readmes, tmp_path.joinpath('rerun.jsonl'), extractors=extractors, worker_number=2, cache_filepath=tmp_path.joinpath('cache.db'))
+    assert statistics == dict(ok=2, error=1, timeout=0, cached=2)
+    with open(tmp_path.joinpath('rerun.jsonl'), 'r', encoding='utf-8') as file:
+        assert {record['id']: record for record in map(json.loads, file)} == records
+
+
+def test_process_pool_imap_rejects_negative_worker_number():
+    with pytest.raises(AssertionError, match='Worker Number Must Be Positive'):
+        list(process_pool_imap(run_task, enumerate(['a']), worker_number=-1))
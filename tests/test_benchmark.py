@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 17:48:19
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 17:48:19
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+from younger.commons.benchmark import BENCHMARKS, run_benchmarks, save_benchmark_results, load_benchmark_results, compare_benchmark_results
+
+
+def test_run_benchmarks(tmp_path):
+    benchmark_results = run_benchmarks(names=['hash_file', 'scan_readme_string'], repeat=1, warmup=0)
+    assert [result['name'] for result in benchmark_results['results']] == ['hash_file', 'scan_readme_string']
+    assert all(0 < result['median'] for result in benchmark_results['results'])
+
+    save_benchmark_results(benchmark_results, tmp_path.joinpath('results.json'))
+    assert load_benchmark_results(tmp_path.joinpath('results.json')) == benchmark_results
+
+
+def test_compare_benchmark_results():
+    def make(medians):
+        return dict(results=[dict(name=name, scale='small', median=median) for name, median in medians.items()])
+
+    comparisons = compare_benchmark_results(make(dict(a=1.05, b=1.5, c=1.0)), make(dict(a=1.0, b=1.0)), threshold=0.1)
+    assert [(comparison['name'], comparison['regressed']) for comparison in comparisons] == [('a', False), ('b', True), ('c', False)]
+    assert comparisons[2]['ratio'] is None
+    assert set(BENCHMARKS) >= {'save_pickle', 'load_pickle', 'hash_file', 'cached_chunks_build', 'cached_chunks_iterate', 'get_dir_size', 'tar_archive', 'scan_readme_string'}
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2025-01-06 19:27:28
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 17:46:03
+# Copyright (c) 2025 Yangs.AI
+# 
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import pathlib
+import functools
+import multiprocessing
+
+import pytest
+
+from younger.commons.cache import CachedChunks
+
+
+def test_cached_chunks(tmp_path):
+    itr = CachedChunks(tmp_path.joinpath('itr'), iter(range(100000)), 1000)
+
+    assert len(itr) == 100000
+    assert all([index == i for index, i in enumerate(i for chunk in itr for i in chunk)])
+
+
+def test_cached_chunks_resume(tmp_path):
+    itr = CachedChunks(tmp_path.joinpath('itr'), iter(range(10)), 4)
+    for chunk in itr:
+        assert chunk == [0, 1, 2, 3]
+        break
+
+    itr = CachedChunks(tmp_path.joinpath('itr'), iter(()), 4)
+    assert itr.current_chunk_id == 0
+    assert itr.current_position == 0
+    assert list(itr) == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    assert itr.current_position == 10
+
+
+def generate_items(marker_dirpath: pathlib.Path, number: int):
+    # Leaves one marker per consumed iterator, i.e. per build.
+    marker_dirpath.joinpath(f'{multiprocessing.current_process().pid}').touch()
+    yield from range(number)
+
+
+def build_cached_chunks(cache_dirpath: pathlib.Path, marker_dirpath: pathlib.Path) -> None:
+    itr = CachedChunks(cache_dirpath, generate_items(marker_dirpath, 10000), 100)
+    assert len(itr) == 10000
+
+
+def test_cached_chunks_concurrent_build(tmp_path):
+    marker_dirpath = tmp_path.joinpath('markers')
+    marker_dirpath.mkdir()
+    processes = [multiprocessing.Process(target=build_cached_chunks, args=(tmp_path.joinpath('itr'), marker_dirpath)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert [process.exitcode for process in processes] == [0, 0, 0, 0]
+    assert len(list(marker_dirpath.iterdir())) == 1
+    assert sum(CachedChunks(tmp_path.joinpath('itr'), iter(()), 100), []) == list(range(10000))
+
+
+def test_cached_chunks_columnar(tmp_path):
+    records = [dict(id=index, value=index / 2, name=f'名称_{index}') for index in range(10)]
+    schema = dict(id='q', value='d', name='str')
+    itr = CachedChunks(tmp_path.joinpath('itr'), iter(records), 4, schema=schema)
+    assert itr.schema == schema
+
+    batches = list(itr.iter_batches())
+    assert [len(batch['id']) for batch in batches] == [4, 4, 2]
+    assert sum((batch['id'].tolist() for batch in batches), []) == list(range(10))
+    assert sum((batch['name'].tolist() for batch in batches), []) == [record['name'] for record in records]
+    assert batches[-1]['value'][-1] == 4.5 and batches[-1]['name'][-1] == '名称_9'
+
+    itr = CachedChunks(tmp_path.joinpath('itr'), iter(()), 4, schema=schema)
+    assert itr.current_chunk_id == 3
+    itr.rewind()
+    assert CachedChunks(tmp_path.joinpath('itr'), iter(()), 4).current_chunk_id == 0
+    assert sum(itr, []) == records
+
+
+def square(item: int) -> int:
+    return item * item
+
+
+def is_even(item: int) -> bool:
+    return item % 2 == 0
+
+
+def to_record(item: int) -> dict:
+    return dict(value=item / 2)
+
+
+def negate(item: int) -> int:
+    return -item
+
+
+def square_unless_marked(marker_filepath: pathlib.Path, item: int) -> int:
+    if item == 25 and marker_filepath.is_file():
+        raise ValueError('Interrupted.')
+    return item * item
+
+
+def test_cached_chunks_map_and_filter(tmp_path):
+    itr = CachedChunks(tmp_path.joinpath('itr'), iter(range(100)), 10)
+
+    squares = itr.map(square, tmp_path.joinpath('squares'), worker_number=2)
+    evens = squares.filter(is_even, tmp_path.joinpath('evens'), worker_number=2)
+    assert sum(squares, []) == [item * item for item in range(100)]
+    assert len(evens) == 50
+    assert sum(evens, []) == [item * item for item in range(0, 100, 2)]
+
+    # Filtered chunks hold 5 items each, the position counts the items of the finished chunks.
+    evens.rewind()
+    for chunk_id, chunk in enumerate(evens):
+        assert len(chunk) == 5
+        if chunk_id == 1:
+            break
+    assert evens.current_position == 5
+    assert CachedChunks(tmp_path.joinpath('evens'), iter(()), 10).current_position == 5
+    list(evens)
+    assert evens.current_position == 50
+
+    columns = itr.map(to_record, tmp_path.joinpath('columns'), schema=dict(value='d'))
+    assert sum((batch['value'].tolist() for batch in columns.iter_batches()), []) == [item / 2 for item in range(100)]
+
+
+def test_cached_chunks_map_resume(tmp_path):
+    itr = CachedChunks(tmp_path.joinpath('itr'), iter(range(100)), 10)
+    marker_filepath = tmp_path.joinpath('marker')
+    marker_filepath.touch()
+    with pytest.raises(RuntimeError):
+        itr.map(functools.partial(square_unless_marked, marker_filepath), tmp_path.joinpath('squares'), worker_number=1)
+    assert not tmp_path.joinpath('squares').exists()
+    assert tmp_path.joinpath('.squares.stage', 'done.1').is_file()
+    assert not tmp_path.joinpath('.squares.stage', 'done.2').is_file()
+
+    marker_filepath.unlink()
+    squares = itr.map(functools.partial(square_unless_marked, marker_filepath), tmp_path.joinpath('squares'), worker_number=1)
+    assert sum(squares, []) == [item * item for item in range(100)]
+    assert not tmp_path.joinpath('.squares.stage').exists()
+
+
+def test_cached_chunks_map_restarts_for_another_function(tmp_path):
+    itr = CachedChunks(tmp_path.joinpath('itr'), iter(range(100)), 10)
+    marker_filepath = tmp_path.joinpath('marker')
+    marker_filepath.touch()
+    with pytest.raises(RuntimeError):
+        itr.map(functools.partial(square_unless_marked, marker_filepath), tmp_path.joinpath('outputs'), worker_number=1)
+    assert tmp_path.joinpath('.outputs.stage', 'done.1').is_file()
+
+    # The interrupted stage belongs to another function, none of its chunks is reused.
+    outputs = itr.map(negate, tmp_path.joinpath('outputs'), worker_number=1)
+    assert sum(outputs, []) == [-item for item in range(100)]
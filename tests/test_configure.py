@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 19:24:51
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 19:24:51
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import os
+import sys
+import pathlib
+import subprocess
+
+import pytest
+
+from younger.commons.configure import CONFIG_SCHEMA, load_config, get_config, set_config
+from younger.commons.cache import get_cache_root
+
+
+def test_load_config_defaults(tmp_path):
+    config = load_config(tmp_path.joinpath('missing.toml'), environ=dict())
+    for section, settings in CONFIG_SCHEMA.items():
+        for name, (_, default) in settings.items():
+            assert getattr(getattr(config, section), name) == default
+    with pytest.raises(AttributeError):
+        config.io.hash_block_size = 1
+
+
+def test_load_config_file_and_environ(tmp_path):
+    config_filepath = tmp_path.joinpath('config.toml')
+    config_filepath.write_text('[io]\nhash_block_size = 4096\ndownload_block_size = 2048\n[pool]\nworker_number = 3\n[cache]\nroot = "~/younger-cache"\n')
+    environ = dict(YOUNGER_CONFIG=str(config_filepath), YOUNGER_IO_HASH_BLOCK_SIZE='8192', YOUNGER_METRICS_ENABLED='true')
+
+    config = load_config(environ=environ)
+    assert config.io.hash_block_size == 8192
+    assert config.io.download_block_size == 2048
+    assert config.pool.worker_number == 3
+    assert config.cache.root == pathlib.Path.home().joinpath('younger-cache')
+    assert config.metrics.enabled is True
+
+
+
+def test_load_config_ignores_invalid_values(tmp_path):
+    config_filepath = tmp_path.joinpath('config.toml')
+    config_filepath.write_text('[io]\nhash_block_size = "big"\n[compression]\ncompress = 1\n[pool]\nworker_number = 3\n')
+    environ = dict(YOUNGER_CONFIG=str(config_filepath), YOUNGER_LOGGING_MODE='bogus', YOUNGER_METRICS_ENABLED='maybe', YOUNGER_POOL_WORKER_NUMBER='many')
+    with pytest.warns(UserWarning, match='Invalid Config'):
+        config = load_config(environ=environ)
+    assert config.io.hash_block_size == CONFIG_SCHEMA['io']['hash_block_size'][1]
+    assert config.compression.compress == CONFIG_SCHEMA['compression']['compress'][1]
+    assert config.logging.mode == CONFIG_SCHEMA['logging']['mode'][1]
+    assert config.metrics.enabled == CONFIG_SCHEMA['metrics']['enabled'][1]
+    # The valid value of the file is kept.
+    assert config.pool.worker_number == 3
+
+    config_filepath.write_text('[io\nhash_block_size = 1\n')
+    with pytest.warns(UserWarning, match='Malformed Config File'):
+        assert load_config(environ=dict(YOUNGER_CONFIG=str(config_filepath))).io.hash_block_size == CONFIG_SCHEMA['io']['hash_block_size'][1]
+
+
+def test_load_config_ignores_out_of_range_values(tmp_path):
+    config_filepath = tmp_path.joinpath('config.toml')
+    config_filepath.write_text('[io]\nhash_block_size = 0\ndownload_block_size = -1\n[compression]\nlevel = 10\n[cache]\nartifacts_max_bytes = -1\n[pool]\nworker_number = 3\n')
+    environ = dict(YOUNGER_CONFIG=str(config_filepath), YOUNGER_POOL_WORKER_NUMBER='-1')
+    with pytest.warns(UserWarning, match='Must Be In') as records:
+        config = load_config(environ=environ)
+    assert len(records) == 5
+    for section, name in [('io', 'hash_block_size'), ('io', 'download_block_size'), ('compression', 'level'), ('cache', 'artifacts_max_bytes')]:
+        assert getattr(getattr(config, section), name) == CONFIG_SCHEMA[section][name][1]
+    assert config.pool.worker_number == 3
+
+    environ = dict(YOUNGER_CONFIG=str(tmp_path.joinpath('missing.toml')), YOUNGER_IO_HASH_BLOCK_SIZE='1', YOUNGER_POOL_WORKER_NUMBER='0', YOUNGER_COMPRESSION_LEVEL='0')
+    config = load_config(environ=environ)
+    assert (config.io.hash_block_size, config.pool.worker_number, config.compression.level) == (1, 0, 0)
+
+
+def test_invalid_config_does_not_break_imports(tmp_path):
+    config_filepath = tmp_path.joinpath('config.toml')
+    config_filepath.write_text('[io]\nhash_block_size = "big"\n')
+    environ = dict(os.environ, YOUNGER_CONFIG=str(config_filepath), YOUNGER_LOGGING_MODE='bogus', YOUNGER_METRICS_ENABLED='maybe')
+    code = 'import younger.commons.io, younger.commons.hash, younger.commons.metrics; younger.commons.io.logger.info("imported")'
+    result = subprocess.run([sys.executable, '-W', 'ignore', '-c', code], env=environ, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert 'imported' in result.stdout
+
+
+def test_get_config_is_cached(tmp_path):
+    config = load_config(tmp_path.joinpath('missing.toml'), environ=dict(YOUNGER_CACHE_ROOT=str(tmp_path)))
+    set_config(config)
+    try:
+        assert get_config() is config
+        assert get_cache_root() == tmp_path
+    finally:
+        set_config(None)
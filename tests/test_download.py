@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 21:03:18
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 21:03:18
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import io
+import tarfile
+import hashlib
+
+import pytest
+
+from younger.commons.io import load_json
+from younger.commons.download import HashingStream, download, stream_download, get_download_metadata_filepath
+
+
+CONTENT = bytes(range(256)) * 64
+
+
+def test_download_revalidates_complete_file(tmp_path, http_server):
+    http_server.files['/a.bin'] = CONTENT
+    filepath = download(f'{http_server.url}/a.bin', tmp_path)
+    assert filepath.read_bytes() == CONTENT
+    assert load_json(get_download_metadata_filepath(filepath))['complete']
+
+    # Unchanged: one conditional request, answered by 304.
+    download(f'{http_server.url}/a.bin', tmp_path)
+    assert http_server.requests[-1]['status'] == 304
+    assert 'If-None-Match' in http_server.requests[-1]['headers']
+
+    # Not forced: the server is not contacted at all.
+    download(f'{http_server.url}/a.bin', tmp_path, force=False)
+    assert len(http_server.requests) == 2
+
+    # Changed: the whole new content is transferred.
+    http_server.files['/a.bin'] = CONTENT[::-1]
+    assert download(f'{http_server.url}/a.bin', tmp_path).read_bytes() == CONTENT[::-1]
+    assert http_server.requests[-1]['status'] == 200
+
+
+def test_download_resumes_partial_file(tmp_path, http_server):
+    http_server.files['/a.bin'] = CONTENT
+    filepath = download(f'{http_server.url}/a.bin', tmp_path)
+    metadata = load_json(get_download_metadata_filepath(filepath))
+
+    with open(filepath, 'r+b') as file:
+        file.truncate(1000)
+    download(f'{http_server.url}/a.bin', tmp_path)
+    assert http_server.requests[-1]['status'] == 206
+    assert http_server.requests[-1]['headers']['If-Range'] == metadata['etag']
+    assert filepath.read_bytes() == CONTENT
+    assert load_json(get_download_metadata_filepath(filepath))['complete']
+
+
+def test_download_restarts_partial_file_of_changed_remote(tmp_path, http_server):
+    http_server.files['/a.bin'] = CONTENT
+    filepath = download(f'{http_server.url}/a.bin', tmp_path)
+
+    with open(filepath, 'r+b') as file:
+        file.truncate(1000)
+    http_server.files['/a.bin'] = CONTENT[::-1]
+    # The If-Range validator no longer matches, so the server falls back to the whole content.
+    download(f'{http_server.url}/a.bin', tmp_path)
+    assert http_server.requests[-1]['status'] == 200
+    assert filepath.read_bytes() == CONTENT[::-1]
+
+
+def test_download_legacy_file_without_metadata(tmp_path, http_server):
+    http_server.files['/a.bin'] = CONTENT
+    filepath = tmp_path.joinpath('a.bin')
+
+    # Complete: 416 on the Range request, and the metadata is recorded.
+    filepath.write_bytes(CONTENT)
+    download(f'{http_server.url}/a.bin', tmp_path)
+    assert http_server.requests[-1]['status'] == 416
+    assert 'If-Range' not in http_server.requests[-1]['headers']
+    assert filepath.read_bytes() == CONTENT
+    assert load_json(get_download_metadata_filepath(filepath))['complete']
+    # The 416 carries no validator, so the file is revalidated by a Range request again, still without any transfer.
+    download(f'{http_server.url}/a.bin', tmp_path)
+    assert http_server.requests[-1]['status'] == 416
+
+    # Partial: resumed.
+    get_download_metadata_filepath(filepath).unlink()
+    filepath.write_bytes(CONTENT[:1000])
+    download(f'{http_server.url}/a.bin', tmp_path)
+    assert http_server.requests[-1]['status'] == 206
+    assert filepath.read_bytes() == CONTENT
+
+    # Longer than the remote: 416, then downloaded again from scratch.
+    get_download_metadata_filepath(filepath).unlink()
+    filepath.write_bytes(CONTENT + b'stale')
+    download(f'{http_server.url}/a.bin', tmp_path)
+    assert [request['status'] for request in http_server.requests[-2:]] == [416, 200]
+    assert filepath.read_bytes() == CONTENT
+
+
+def make_tar_archive(members: dict[str, bytes], compress: bool = True) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz' if compress else 'w') as tar:
+        for name, content in members.items():
+            member = tarfile.TarInfo(name)
+            member.size = len(content)
+            tar.addfile(member, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def test_hashing_stream():
+    blocks = [b'ab', b'', b'cde', b'f' * 10]
+    sink = io.BytesIO()
+    stream = HashingStream(iter(blocks), hashlib.sha256(), sink=sink)
+    assert stream.read(3) == b'abc'
+    assert stream.read(1) == b'd'
+    stream.drain()
+    assert stream.read() == b''
+    assert stream.size == 15
+    assert sink.getvalue() == b''.join(blocks)
+    assert stream.hexdigest() == hashlib.sha256(b''.join(blocks)).hexdigest()
+
+
+def test_stream_download_keeps_archive(tmp_path, http_server):
+    archive = make_tar_archive({'a.txt': b'A'})
+    http_server.files['/release.tar.gz'] = archive
+    digest = stream_download(f'{http_server.url}/release.tar.gz', dirpath=tmp_path.joinpath('keep'))
+    assert digest == hashlib.sha256(archive).hexdigest()
+    assert tmp_path.joinpath('keep', 'release.tar.gz').read_bytes() == archive
+    assert load_json(get_download_metadata_filepath(tmp_path.joinpath('keep', 'release.tar.gz')))['complete']
+
+
+def test_stream_download_extracts_archive(tmp_path, http_server):
+    archive = make_tar_archive({'a.txt': b'A', 'sub/b.txt': b'B'}, compress=False)
+    http_server.files['/release.tar'] = archive
+    stream_download(f'{http_server.url}/release.tar', extract_dirpath=tmp_path.joinpath('release'), compress=False, checksum=hashlib.sha256(archive).hexdigest())
+    assert tmp_path.joinpath('release', 'a.txt').read_bytes() == b'A'
+    assert tmp_path.joinpath('release', 'sub', 'b.txt').read_bytes() == b'B'
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['release']
+
+
+def test_stream_download_cleans_up_on_checksum_mismatch(tmp_path, http_server):
+    http_server.files['/release.tar.gz'] = make_tar_archive({'a.txt': b'A'})
+    with pytest.raises(ValueError, match='Checksum Mismatch'):
+        stream_download(f'{http_server.url}/release.tar.gz', dirpath=tmp_path.joinpath('keep'), extract_dirpath=tmp_path.joinpath('release'), checksum='0' * 64)
+    assert list(tmp_path.joinpath('keep').iterdir()) == []
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['keep']
+
+
+def test_stream_download_rejects_path_traversal(tmp_path, http_server):
+    http_server.files['/evil.tar.gz'] = make_tar_archive({'a.txt': b'A', '../escape.txt': b'escaped'})
+    extract_dirpath = tmp_path.joinpath('inner', 'release')
+    with pytest.raises(ValueError, match='Unsafe Member'):
+        stream_download(f'{http_server.url}/evil.tar.gz', extract_dirpath=extract_dirpath)
+    assert not any(path.name == 'escape.txt' for path in tmp_path.rglob('*'))
+    assert list(tmp_path.joinpath('inner').iterdir()) == []
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 15:41:09
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 15:41:09
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import os
+import sys
+import subprocess
+
+import pytest
+
+
+HEAVY_MODULES = ['requests', 'fsspec', 'tqdm', 'psutil', 'tomlkit', 'semantic_release']
+
+# Cumulative import time budget (microseconds), generous enough for slow CI machines.
+IMPORT_TIME_BUDGET = int(os.environ.get('YOUNGER_IMPORT_TIME_BUDGET', 500000))
+
+
+def get_import_times(module_name: str) -> dict[str, int]:
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module_name}'], capture_output=True, text=True, check=True)
+    import_times = dict()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+@pytest.mark.parametrize('module_name', ['younger', 'younger.commons', 'younger.commons.hash', 'younger.commons.string', 'younger.commands.main'])
+def test_import_is_light(module_name):
+    import_times = get_import_times(module_name)
+    for heavy_module in HEAVY_MODULES:
+        assert heavy_module not in import_times, f'\'{module_name}\' Imports \'{heavy_module}\' Eagerly.'
+    assert import_times[module_name] < IMPORT_TIME_BUDGET, f'\'{module_name}\' Takes {import_times[module_name]}us To Import.'
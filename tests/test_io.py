@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 20:14:33
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 20:14:33
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import io
+import json
+import pytest
+
+from younger.commons.io import iterate_json, iterate_json_from_stream, save_json
+
+
+DOCUMENTS = [
+    '[]', ' { } ',
+    ' [1, 2.5e3, -3, 3.25E+7, -0.0, true, false, null, "a\\"b", [1, [2]], {"x": {"y": []}}] ',
+    '{"a": 1, "b": [1, 2], "\\u00e7": "\\ud83d\\ude00", "n": 12345678901234567890}',
+    '[\n  123456789\n]\n',
+    '[NaN, Infinity, -Infinity, "\\ud83d\\ude00\\u00e9\\n", "' + 'x' * 40 + '", -1.5e-3]',
+]
+
+
+@pytest.mark.parametrize('document', DOCUMENTS)
+def test_iterate_json_from_stream_matches_json_loads(document):
+    expected = json.loads(document)
+    expected = list(expected.items()) if isinstance(expected, dict) else expected
+    # Tiny blocks cut every element, key and number at every possible offset.
+    for block_size in range(1, 16):
+        assert list(iterate_json_from_stream(io.StringIO(document), block_size=block_size)) == expected
+
+
+@pytest.mark.parametrize('document', ['', '3', '"a"', '[1,]', '[1 2]', '[1.]', '[1', '{"a" 1}', '{1: 2}', '{"a": 1,}', '[1] x'])
+def test_iterate_json_from_stream_rejects_invalid_documents(document):
+    for block_size in (1, 4, 1024):
+        with pytest.raises(json.JSONDecodeError):
+            list(iterate_json_from_stream(io.StringIO(document), block_size=block_size))
+
+
+class CountingStream(io.StringIO):
+    def __init__(self, value: str):
+        super().__init__(value)
+        self.number_of_read_characters = 0
+
+    def read(self, size: int = -1) -> str:
+        data = super().read(size)
+        self.number_of_read_characters += len(data)
+        return data
+
+
+def test_iterate_json_from_stream_fails_fast():
+    stream = CountingStream('[1, x' + ', 2' * 2_000_000 + ']')
+    with pytest.raises(json.JSONDecodeError, match='Expecting value'):
+        list(iterate_json_from_stream(stream, block_size=1024))
+    assert stream.number_of_read_characters <= 1024
+
+
+def test_iterate_json(tmp_path):
+    records = [dict(id=index, name=f'node_{index}', shape=[index] * 4) for index in range(1000)]
+    save_json(records, tmp_path.joinpath('records.json'))
+    assert list(iterate_json(tmp_path.joinpath('records.json'), block_size=100)) == records
+
+    save_json(dict(enumerate(records)), tmp_path.joinpath('records_by_id.json'))
+    assert list(iterate_json(tmp_path.joinpath('records_by_id.json'), block_size=100)) == [(str(index), record) for index, record in enumerate(records)]
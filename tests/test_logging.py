@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 22:02:51
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 22:02:51
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import os
+import sys
+import json
+import time
+import logging
+import subprocess
+import multiprocessing
+
+import pytest
+
+from younger.commons.logging import set_logger, logger_listeners, stop_logger_listener
+
+
+def read_lines(filepath) -> list[str]:
+    return filepath.read_text(encoding='utf-8').splitlines()
+
+
+def test_asynchronous_logger_merges_messages_on_caller(tmp_path):
+    logger = set_logger('test-async-merge', mode='file', logging_filepath=tmp_path.joinpath('log'), show_setting_log=False, asynchronous=True)
+    state = dict(step='initial')
+    for _ in range(3):
+        logger.info('state %s', state)
+    state['step'] = 'MUTATED'
+    try:
+        raise KeyError('boom')
+    except KeyError:
+        logger.exception('failed')
+    stop_logger_listener('test-async-merge')
+
+    lines = read_lines(tmp_path.joinpath('log'))
+    assert [line.partition('] ')[2] for line in lines[:3]] == ['state {\'step\': \'initial\'}'] * 3
+    assert lines[3].endswith('failed') and lines[-1] == 'KeyError: \'boom\''
+
+
+def test_asynchronous_logger_flushes_on_stop_and_reconfiguration(tmp_path):
+    logger = set_logger('test-async-stop', mode='file', logging_filepath=tmp_path.joinpath('log'), show_setting_log=False, asynchronous=True)
+    listener = logger_listeners['test-async-stop']
+    for index in range(1000):
+        logger.info(f'first {index}')
+
+    # Reconfiguring stops the former listener, after it wrote every queued record.
+    logger = set_logger('test-async-stop', mode='file', logging_filepath=tmp_path.joinpath('log'), show_setting_log=False, asynchronous=True)
+    assert listener._thread is None
+    assert len(read_lines(tmp_path.joinpath('log'))) == 1000
+
+    for index in range(1000):
+        logger.info(f'second {index}')
+    stop_logger_listener('test-async-stop')
+    assert 'test-async-stop' not in logger_listeners
+    assert len(read_lines(tmp_path.joinpath('log'))) == 2000
+
+
+def test_asynchronous_logger_flushes_at_exit(tmp_path):
+    code = (
+        'from younger.commons.logging import set_logger\n'
+        f'logger = set_logger("test-async-exit", mode="file", logging_filepath={str(tmp_path.joinpath("log"))!r}, show_setting_log=False, asynchronous=True)\n'
+        'for index in range(1000):\n'
+        '    logger.info(f"record {index}")\n'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+    assert len(read_lines(tmp_path.joinpath('log'))) == 1000
+
+
+def log_in_child(name: str) -> None:
+    assert len(logger_listeners) == 0
+    logging.getLogger(name).info(f'child {os.getpid()}')
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='Only Forked Children Inherit Loggers.')
+def test_asynchronous_logger_in_forked_child(tmp_path):
+    logger = set_logger('test-async-fork', mode='file', logging_filepath=tmp_path.joinpath('log'), show_setting_log=False, asynchronous=True)
+    logger.info('parent')
+    process = multiprocessing.get_context('fork').Process(target=log_in_child, args=('test-async-fork', ))
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+    stop_logger_listener('test-async-fork')
+
+    lines = read_lines(tmp_path.joinpath('log'))
+    assert sorted(line.partition('] ')[2] for line in lines) == [f'child {process.pid}', 'parent']
+
+
+def log_floods(logger, number: int) -> None:
+    for index in range(number):
+        logger.warning(f'flood {index}')
+
+
+def test_rate_limited_logger_reports_suppressed_records(tmp_path):
+    logger = set_logger('test-rate-limit', mode='file', logging_filepath=tmp_path.joinpath('log'), show_setting_log=False, rate_limit=2, rate_period=0.2)
+    log_floods(logger, 10)
+    assert len(read_lines(tmp_path.joinpath('log'))) == 2
+
+    # The flood stopped, its count is reported at the end of the period by a summary record.
+    time.sleep(0.5)
+    lines = read_lines(tmp_path.joinpath('log'))
+    assert [line.partition('] ')[2] for line in lines] == ['flood 0', 'flood 1', 'flood 9 [8 Similar Messages Suppressed]']
+
+    # Nothing is pending anymore, so the next period starts from zero.
+    log_floods(logger, 1)
+    assert read_lines(tmp_path.joinpath('log'))[-1].endswith('] flood 0')
+
+
+def test_rate_limited_logger_reports_suppressed_records_at_exit(tmp_path):
+    code = (
+        'from younger.commons.logging import set_logger\n'
+        f'logger = set_logger("test-rate-limit-exit", mode="file", logging_filepath={str(tmp_path.joinpath("log"))!r}, show_setting_log=False, asynchronous=True, style="json", rate_limit=2, rate_period=60)\n'
+        'for index in range(10):\n'
+        '    logger.warning(f"flood {index}")\n'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+    entries = [json.loads(line) for line in read_lines(tmp_path.joinpath('log'))]
+    assert [(entry['message'], entry.get('suppressed', 0)) for entry in entries] == [('flood 0', 0), ('flood 1', 0), ('flood 9', 8)]
+
+
+def check_appending_handlers_in_child(name: str) -> None:
+    handlers = logging.getLogger(name).handlers
+    assert len(handlers) == 1 and type(handlers[0]) is logging.handlers.WatchedFileHandler
+    logging.getLogger(name).info(f'child {os.getpid()}')
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='Only Forked Children Inherit Loggers.')
+def test_rotating_asynchronous_logger_in_forked_child(tmp_path):
+    logger = set_logger('test-rotate-fork', mode='file', logging_filepath=tmp_path.joinpath('log'), show_setting_log=False, asynchronous=True, max_bytes=1024, backup_count=3)
+    process = multiprocessing.get_context('fork').Process(target=check_appending_handlers_in_child, args=('test-rotate-fork', ))
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+    assert isinstance(logger_listeners['test-rotate-fork'].handlers[0], logging.handlers.RotatingFileHandler)
+    stop_logger_listener('test-rotate-fork')
+    assert read_lines(tmp_path.joinpath('log'))[-1].endswith(f'] child {process.pid}')
+
+
+def test_default_logger_handles_first_record_once(tmp_path):
+    tmp_path.joinpath('config.toml').write_text(f'[logging]\nmode = "both"\nfilepath = {str(tmp_path.joinpath("log"))!r}\n')
+    code = (
+        'from younger.commons.logging import logger\n'
+        'logger.info("first")\n'
+        'logger.info("second")\n'
+    )
+    environ = dict(os.environ, YOUNGER_CONFIG=str(tmp_path.joinpath('config.toml')))
+    result = subprocess.run([sys.executable, '-c', code], env=environ, capture_output=True, text=True, check=True)
+    assert [line.partition('] ')[2] for line in result.stdout.splitlines()] == ['first', 'second']
+    assert [line.partition('] ')[2] for line in read_lines(tmp_path.joinpath('log'))] == ['first', 'second']
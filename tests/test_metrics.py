@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 16:58:12
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 16:58:12
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import json
+
+from younger.commons.io import load_pickle, save_pickle
+from younger.commons.hash import hash_file
+from younger.commons.cache import CachedChunks
+from younger.commons.metrics import set_metrics_enabled, get_metrics_registry, export_metrics
+
+
+def test_metrics_are_disabled_by_default(tmp_path):
+    get_metrics_registry().clear()
+    save_pickle(list(range(100)), tmp_path.joinpath('object.pkl'))
+    assert get_metrics_registry().to_dict() == dict()
+
+
+def test_metrics_of_io_hash_and_cache(tmp_path):
+    get_metrics_registry().clear()
+    set_metrics_enabled(True)
+    try:
+        filepath = tmp_path.joinpath('object.pkl')
+        save_pickle(list(range(100)), filepath)
+        assert load_pickle(filepath) == list(range(100))
+        hash_file(filepath)
+        chunks = list(CachedChunks(tmp_path.joinpath('chunks'), iter(range(10)), 4))
+        assert sum(chunks, []) == list(range(10))
+    finally:
+        set_metrics_enabled(False)
+
+    metrics = get_metrics_registry().to_dict()
+    assert metrics['younger_io_pickle_read_bytes_total']['value'] >= filepath.stat().st_size
+    assert metrics['younger_hash_file_bytes_total']['value'] == filepath.stat().st_size
+    assert metrics['younger_cache_chunk_load_seconds']['count'] == 3
+    assert metrics['younger_cache_chunks_loaded_total']['value'] == 3
+
+    export_metrics(tmp_path.joinpath('metrics.json'))
+    assert json.loads(tmp_path.joinpath('metrics.json').read_text()) == metrics
+
+    export_metrics(tmp_path.joinpath('metrics.prom'))
+    lines = tmp_path.joinpath('metrics.prom').read_text().splitlines()
+    assert '# TYPE younger_cache_chunk_load_seconds histogram' in lines
+    assert 'younger_cache_chunk_load_seconds_bucket{le="+Inf"} 3' in lines
+    assert 'younger_cache_chunk_load_seconds_count 3' in lines
+    get_metrics_registry().clear()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 22:37:14
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 22:37:14
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import json
+import pstats
+import tracemalloc
+
+from click.testing import CliRunner
+
+from younger.commands.main import main
+from younger.commons.profiling import profiling
+
+
+def test_profiling(tmp_path, capsys):
+    with profiling(tmp_path, name='unit', cpu=True, memory=True, top=5):
+        objects = [list(range(100)) for _ in range(100)]
+    assert len(objects) == 100
+
+    stderr = capsys.readouterr().err
+    assert '=== CPU Profile (Top 5 By cumulative)' in stderr
+    assert '=== Memory Trace (Top 5 Allocation Sites' in stderr
+    pstats.Stats(str(next(tmp_path.glob('unit-*.prof'))))
+    tracemalloc.Snapshot.load(str(next(tmp_path.glob('unit-*.tracemalloc'))))
+
+
+def test_profile_options(tmp_path):
+    readmes_filepath = tmp_path.joinpath('readmes.jsonl')
+    readmes_filepath.write_text('\n'.join(json.dumps(dict(id=index, readme=f'Trained on 2024-12-{index + 10}.')) for index in range(3)) + '\n')
+    profile_dirpath = tmp_path.joinpath('profiles')
+
+    result = CliRunner().invoke(main, [
+        '--profile', '--trace-memory', '--profile-dirpath', str(profile_dirpath), '--profile-top', '5', '--profile-sort', 'tottime',
+        'commons', 'analyze-readmes', '--source', str(readmes_filepath), '--output', str(tmp_path.joinpath('results.jsonl')), '--worker-number', '1',
+    ])
+    assert result.exit_code == 0, result.output
+    assert 'ok: 3' in result.stdout
+    assert '=== CPU Profile (Top 5 By tottime)' in result.stderr
+    assert '=== Memory Trace (Top 5 Allocation Sites' in result.stderr
+    assert len(list(profile_dirpath.glob('younger-commons-*.prof'))) == 1
+    assert len(list(profile_dirpath.glob('younger-commons-*.tracemalloc'))) == 1
+
+
+def test_profile_options_of_failing_subcommand(tmp_path):
+    profile_dirpath = tmp_path.joinpath('profiles')
+    result = CliRunner().invoke(main, ['--profile', '--profile-dirpath', str(profile_dirpath), 'commons', 'benchmark', '--names', 'missing'])
+    assert isinstance(result.exception, AssertionError)
+    assert '=== CPU Profile' in result.stderr
+    assert len(list(profile_dirpath.glob('younger-commons-*.prof'))) == 1
+    assert len(list(profile_dirpath.glob('younger-commons-*.tracemalloc'))) == 0
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 21:31:40
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 21:31:40
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import types
+import hashlib
+import itertools
+
+import pytest
+
+from younger.commons.store import ArtifactStore
+from younger.commons.hash import hash_file
+from younger.commons.download import download, stream_download
+
+
+def test_artifact_store_deduplicates(tmp_path):
+    store = ArtifactStore(tmp_path.joinpath('store'))
+    tmp_path.joinpath('a.bin').write_bytes(b'x' * 100)
+    tmp_path.joinpath('b.bin').write_bytes(b'x' * 100)
+
+    digest = store.ingest(tmp_path.joinpath('a.bin'))
+    assert store.ingest(tmp_path.joinpath('b.bin')) == digest
+    assert store.has(digest)
+    assert store.get_size() == 100
+    assert tmp_path.joinpath('b.bin').read_bytes() == b'x' * 100
+
+    materialized = store.materialize(digest, tmp_path.joinpath('c', 'c.bin'))
+    assert materialized.read_bytes() == b'x' * 100
+    assert store.get_size() == 100
+
+
+def test_artifact_store_references_keep_objects(tmp_path):
+    store = ArtifactStore(tmp_path.joinpath('store'))
+    tmp_path.joinpath('a.bin').write_bytes(b'a' * 100)
+    tmp_path.joinpath('b.bin').write_bytes(b'b' * 100)
+    digest_a = store.ingest(tmp_path.joinpath('a.bin'))
+    digest_b = store.ingest(tmp_path.joinpath('b.bin'))
+
+    assert store.evict(0) == []
+
+    # A removed path is pruned, a released path is no longer tracked, both objects become evictable.
+    tmp_path.joinpath('a.bin').unlink()
+    assert store.evict(0) == [digest_a]
+    store.release(tmp_path.joinpath('b.bin'))
+    assert store.evict(0) == [digest_b]
+    assert tmp_path.joinpath('b.bin').read_bytes() == b'b' * 100
+    assert store.get_size() == 0
+
+
+def test_artifact_store_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr('younger.commons.store.time', types.SimpleNamespace(time=itertools.count().__next__))
+    store = ArtifactStore(tmp_path.joinpath('store'))
+    digests = dict()
+    for name in ['a', 'b', 'c']:
+        tmp_path.joinpath(name).write_bytes(name.encode() * 100)
+        digests[name] = store.ingest(tmp_path.joinpath(name), url=f'http://host/{name}')
+    store.materialize(digests['a'], tmp_path.joinpath('a.copy'))
+    for name in ['a', 'b', 'c', 'a.copy']:
+        store.release(tmp_path.joinpath(name))
+
+    assert store.evict(150) == [digests['b'], digests['c']]
+    assert store.has(digests['a'])
+    assert store.lookup('http://host/a')['digest'] == digests['a']
+    assert store.lookup('http://host/b') is None
+
+
+def test_download_reuses_artifact_store(tmp_path, http_server):
+    http_server.files['/a.bin'] = b'a' * 1000
+    store = ArtifactStore(tmp_path.joinpath('store'))
+
+    download(f'{http_server.url}/a.bin', tmp_path.joinpath('first'), store=store)
+    assert store.lookup(f'{http_server.url}/a.bin')['size'] == 1000
+
+    # Materialized from the store, then only revalidated.
+    filepath = download(f'{http_server.url}/a.bin', tmp_path.joinpath('second'), store=store)
+    assert filepath.read_bytes() == b'a' * 1000
+    assert [request['status'] for request in http_server.requests] == [200, 304]
+
+    filepath = download(f'{http_server.url}/a.bin', tmp_path.joinpath('third'), force=False, store=store)
+    assert filepath.read_bytes() == b'a' * 1000
+    assert len(http_server.requests) == 2
+
+
+def test_downloads_never_write_through_artifact_store(tmp_path, http_server):
+    http_server.files['/a.bin'] = b'a' * 1000
+    store = ArtifactStore(tmp_path.joinpath('store'))
+    download(f'{http_server.url}/a.bin', tmp_path.joinpath('first'), store=store)
+    filepath = download(f'{http_server.url}/a.bin', tmp_path.joinpath('second'), store=store)
+    digest = store.lookup(f'{http_server.url}/a.bin')['digest']
+
+    # The remote changed, a failing stream download keeps both the materialized file and the object.
+    http_server.files['/a.bin'] = b'b' * 1000
+    with pytest.raises(ValueError, match='Checksum Mismatch'):
+        stream_download(f'{http_server.url}/a.bin', dirpath=filepath.parent, checksum='deadbeef')
+    assert filepath.read_bytes() == b'a' * 1000
+    assert hash_file(store.get_object_filepath(digest)) == digest
+
+    stream_download(f'{http_server.url}/a.bin', dirpath=filepath.parent, checksum=hashlib.sha256(b'b' * 1000).hexdigest())
+    assert filepath.read_bytes() == b'b' * 1000
+    assert hash_file(store.get_object_filepath(digest)) == digest
+
+    # The remote grew, resuming a materialized file without validators appends to a private copy.
+    http_server.files['/a.bin'] = b'a' * 1500
+    filepath = store.materialize(digest, tmp_path.joinpath('third', 'a.bin'))
+    download(f'{http_server.url}/a.bin', tmp_path.joinpath('third'))
+    assert http_server.requests[-1]['status'] == 206
+    assert filepath.read_bytes() == b'a' * 1500
+    assert hash_file(store.get_object_filepath(digest)) == digest
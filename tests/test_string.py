@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 11:02:47
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 11:02:47
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import re
+import time
+
+from younger.commons.string import (
+    README_TABLE_Pattern,
+    scan_readme_string,
+    extract_possible_tables_from_readme_string,
+    extract_possible_digits_from_readme_string,
+    extract_possible_dates_from_readme_string,
+    extract_possible_datetimes_from_readme_string,
+    split_front_matter_from_readme_string,
+)
+
+
+def extract_possible_tables_from_readme_string_by_regex(readme: str) -> list[dict[str, list[str]]]:
+    # The former (backtracking) implementation, kept as the reference of the regression corpus.
+    def extract_cells(row: str) -> list[str]:
+        cell_str = row.strip()
+        cell_str = cell_str[ 1:  ] if len(cell_str) and cell_str[ 0] == '|' else cell_str
+        cell_str = cell_str[  :-1] if len(cell_str) and cell_str[-1] == '|' else cell_str
+        cells = [cell.strip() for cell in cell_str.split('|')]
+        return cells
+
+    readme = readme.strip() + '\n'
+    possible_tables = list()
+    for match_result in re.finditer(README_TABLE_Pattern, readme, re.MULTILINE):
+        headers = extract_cells(match_result.group(1))
+        rows = [extract_cells(row) for row in match_result.group(3).strip().split('\n')]
+        possible_tables.append(dict(headers=headers, rows=rows))
+    return possible_tables
+
+
+README_CORPUS = [
+    '',
+    'No table here.\nJust | one pipe.',
+    (
+        '---\nlicense: mit\n---\n# Model\n\n'
+        '| Metric | Value |\n|--------|-------|\n| Accuracy | 0.91 |\n| F1 | 0.88 |\n\nSome text after.\n'
+    ),
+    'Metric | Value\n--- | ---\nAccuracy | 0.91\nF1 | 0.88',
+    '| Left | Center | Right |\n|:-----|:------:|------:|\n| a | b | c |\n| d | e | f |\n',
+    '| A | B |\r\n|---|---|\r\n| 1 | 2 |\r\n| 3 | 4 |\r\n\r\nEnd\r\n',
+    '| A | B |\n|---|---|\n| 1 | 2 |\n| C | D |\n|---|---|\n| 5 | 6 |\n',
+    '| A | B |\n|---|---|\n| 1 | 2 |\n\n| C | D |\n|---|---|\n| 5 | 6 |\n',
+    '| Only |\n|------|\n| one |\n',
+    '| A | B |\n|---|---|\n',
+    '| A | B |\n|---|---|\nno pipe row\n',
+    '| A | B |\n| --- | --- |\n|  |  |\n| x |  |\n',
+    'text before | with pipe\n| A | B |\n|---|---|\n| 1 | 2 |',
+    '```\nx = a | b\n```\n| A | B |\n| - | - |\n| 1 | 2 |\n',
+    '| A | B |\n|---|---| \n| 1 | 2 |\n',
+    '  | A | B |\n  |---|---|\n  | 1 | 2 |\n',
+    '| A | B |\n|---||---|\n| 1 | 2 |\n',
+    '| A | B |\n|-:-|---|\n| 1 | 2 |\n',
+    '| A | B |\n|::---|---|\n| 1 | 2 |\n',
+    'prefix\rA | B\n---|---\n1 | 2\n',
+    '| A | B |\n|---|---|\n| 1 \r| 2 |\n| 3 | 4 |\n',
+    '| A | B |\n|---|---|\n| 1 | 2 |\n| 3 | 4 |\n' * 20,
+    '| 模型 | 准确率 |\n|---|---|\n| Younger | 99% |\n',
+    '|a|b|c|d|e|\n|-|-|-|-|-|\n|1|2|3|4|5|\n|6|7|8|9|0|',
+]
+
+
+def test_tables_regression_corpus():
+    for readme in README_CORPUS:
+        assert extract_possible_tables_from_readme_string(readme) == extract_possible_tables_from_readme_string_by_regex(readme), repr(readme)
+
+
+def test_tables_pathological_readme_is_linear():
+    readme = ('a |' * 3000 + '\n') * 50 + '| A | B |\n|---|---|\n| 1 | 2 |\n'
+    start = time.perf_counter()
+    tables = extract_possible_tables_from_readme_string(readme)
+    assert time.perf_counter() - start < 1.0
+    assert tables[-1] == dict(headers=['A', 'B'], rows=[['1', '2']])
+
+
+def test_scan_readme_string_equals_extractors():
+    for readme in README_CORPUS + ['---\nlicense: mit\ndate: 2024-12-27\n---\nTrained on 2024/12/27 10:30 for 3 epochs, +1.5% over baseline, January 2025.\n']:
+        results = scan_readme_string(readme)
+        assert results['tables'] == extract_possible_tables_from_readme_string(readme)
+        assert results['digits'] == extract_possible_digits_from_readme_string(readme)
+        assert results['dates'] == extract_possible_dates_from_readme_string(readme)
+        assert results['datetimes'] == extract_possible_datetimes_from_readme_string(readme)
+        assert results['front_matter'] == split_front_matter_from_readme_string(readme)
+        assert list(scan_readme_string(readme, extractors=['tables'])) == ['tables']
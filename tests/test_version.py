@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 18:40:26
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 18:40:26
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import itertools
+
+from younger.commons.version import VersionIndex, parse_semantic, check_semantic, str_to_sem, sem_to_str
+
+
+VERSIONS = [
+    '1.2.3', '0.0.1-a.2', '0.0.1-alpha.2', '1.0.0-rc.0', '1.0.0-rc.1.beta', '1.0.0-1', '1.0.0-rc', '01.2.3', '1.2', '1.2.3+build.5', '1.2.3-rc.1+b',
+    'v1.2.3', '1.2.3-a-b.c.10', '1.2.3-beta.2', '1.2.3-beta.11', '1.2.3-alpha.1.2', '', ' 1.2.3', '1.2.3\n', '1.2.3-0.1', '1.2.3-x.0', None,
+]
+
+
+def test_parse_semantic_is_compatible_with_str_to_sem():
+    valid_versions = list()
+    for version in VERSIONS:
+        try:
+            sem_ver = str_to_sem(version)
+        except Exception:
+            assert not check_semantic(version), repr(version)
+            continue
+        assert check_semantic(version), repr(version)
+        assert str(parse_semantic(version)) == sem_to_str(sem_ver)
+        valid_versions.append(version)
+
+    for a, b in itertools.product(valid_versions, valid_versions):
+        assert (parse_semantic(a) < parse_semantic(b)) == (str_to_sem(a) < str_to_sem(b)), (a, b)
+        assert (parse_semantic(a) == parse_semantic(b)) == (str_to_sem(a) == str_to_sem(b)), (a, b)
+
+
+def test_version_index():
+    index = VersionIndex(['1.0.0', '1.2.0', '1.2.5', '1.3.0', '2.0.0-rc.1', '2.0.0', '0.2.3', '0.2.9', '0.3.0', '0.0.3', '0.0.4'])
+    assert index.update(['3.0.0', 'invalid']) == ['invalid']
+    assert len(index) == 12 and '2.0.0' in index and '9.9.9' not in index
+
+    assert index.latest('^1.2') == '1.3.0'
+    assert index.latest('~1.2') == '1.2.5'
+    assert index.latest('^0.2.3') == '0.2.9'
+    assert index.latest('^0.0.3') == '0.0.3'
+    assert index.latest('<2') == '1.3.0'
+    assert index.latest('<2.0.0', include_prerelease=True) == '2.0.0-rc.1'
+    assert index.latest('>=2, <3', include_prerelease=True) == '2.0.0'
+    assert index.latest('^4') is None
+    assert index.latest() == '3.0.0'
+    assert index.select('>=1.0.0 <1.2.5') == ['1.0.0', '1.2.0']
+    assert index.select('1.2 || ^0.2') == ['0.2.3', '0.2.9', '1.2.0', '1.2.5']
+    assert index.select('>1.2') == ['1.3.0', '2.0.0', '3.0.0']
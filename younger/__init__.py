@@ -14,9 +14,22 @@
 ########################################################################
 
 
-from . import commons
+import importlib
 
-import importlib.metadata
 
+# Submodules and '__version__' are loaded on first access (PEP 562), so that 'import younger' stays cheap.
+def __getattr__(name: str):
+    if name == 'commons':
+        return importlib.import_module(f'{__name__}.{name}')
 
-__version__ = importlib.metadata.version("younger")
+    if name == '__version__':
+        import importlib.metadata
+        global __version__
+        __version__ = importlib.metadata.version("younger")
+        return __version__
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | {'commons', '__version__'})
@@ -16,24 +16,70 @@
 
 import click
 import traceback
-
-from importlib.metadata import entry_points
+import importlib.util
 
 
 def install_plugin_click_group(click_group_name: str, entry_point_group: str, entry_point_name: str):
     def decorator(click_group):
         assert isinstance(click_group, click.Group), TypeError("Plugins Can Only Be Attached to An Instance of click.Group()")
+        lazy_plugin_click_group = LazyPluginGroup(
+            click_group_name, entry_point_group, entry_point_name,
+            name=click_group.name,
+            commands=click_group.commands,
+            callback=click_group.callback,
+            params=click_group.params,
+            help=click_group.help,
+            short_help=click_group.short_help,
+        )
+        return lazy_plugin_click_group
+    return decorator
+
+
+class LazyPluginGroup(click.Group):
+    r"""A click group whose commands are provided by a plugin, which is imported only when one of its commands is looked up.
+
+    Listing the group itself (e.g. in the help of its parent) only reads the entry point metadata, without importing the plugin.
+    """
+    def __init__(self, click_group_name: str, entry_point_group: str, entry_point_name: str, **kwargs):
+        click.Group.__init__(self, **kwargs)
+        self._click_group_name = click_group_name
+        self._entry_point_group = entry_point_group
+        self._entry_point_name = entry_point_name
+        self._plugin_loaded = False
+
+    def plugin_exists(self) -> bool:
+        # Looks up the entry point and the top-level package of the plugin, without importing anything.
+        from importlib.metadata import entry_points
+        matched_entry_points = tuple(entry_points(group=self._entry_point_group, name=self._entry_point_name))
+        return len(matched_entry_points) != 0 and importlib.util.find_spec(matched_entry_points[0].module.split('.')[0]) is not None
+
+    def load_plugin(self) -> None:
+        if self._plugin_loaded:
+            return
+        self._plugin_loaded = True
         try:
-            entry_point = entry_points(group=entry_point_group, name=entry_point_name)[0]
+            from importlib.metadata import entry_points
+            entry_point = tuple(entry_points(group=self._entry_point_group, name=self._entry_point_name))[0]
             plugin_click_group = entry_point.load()
             assert isinstance(plugin_click_group, click.Group)
             for name, cmd in plugin_click_group.commands.items():
-                click_group.add_command(cmd, name=name)
+                self.add_command(cmd, name=name)
         except Exception:
-            click_group.add_command(MissingCommand(click_group_name, entry_point_group, entry_point_name))
+            self.add_command(MissingCommand(self._click_group_name, self._entry_point_group, self._entry_point_name))
 
-        return click_group
-    return decorator
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        self.load_plugin()
+        return click.Group.list_commands(self, ctx)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        self.load_plugin()
+        return click.Group.get_command(self, ctx, cmd_name)
+
+    def get_short_help_str(self, limit: int = 45) -> str:
+        if self.short_help is None and self.help is None and not self._plugin_loaded and not self.plugin_exists():
+            plugin = self._entry_point_group.replace('.', '-') + '-' + self._entry_point_name
+            return f'\u2020\U0001F4A9 Warning: The sub-module "{plugin}" is missing.'
+        return click.Group.get_short_help_str(self, limit)
 
 
 class MissingCommand(click.Command):
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 13:58:42
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 13:58:42
+# Copyright (c) 2026 Yangs.AI
+# 
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import click
+import pathlib
+
+
+@click.group(name='commons')
+def commons():
+    pass
+
+
+@commons.command(name='analyze-readmes')
+@click.option('--source', required=True, type=click.Path(exists=True, path_type=pathlib.Path), help='A directory of README files, or a JSONL file with one README per line.')
+@click.option('--output', required=True, type=click.Path(path_type=pathlib.Path), help='The JSONL file the results are written into, one line per README.')
+@click.option('--extractors', default='tables,digits,dates,datetimes,front_matter', show_default=True, help='Comma-separated extractors to run.')
+@click.option('--pattern', default='*.md', show_default=True, help='The filename pattern of READMEs, if SOURCE is a directory.')
+@click.option('--id-key', default='id', show_default=True, help='The key of README IDs, if SOURCE is a JSONL file.')
+@click.option('--readme-key', default='readme', show_default=True, help='The key of READMEs, if SOURCE is a JSONL file.')
+@click.option('--worker-number', default=None, type=int, help='The number of worker processes. Defaults to the number of CPUs.')
+@click.option('--timeout', default=60.0, type=float, show_default=True, help='The time limit (in seconds) of analyzing one README.')
+@click.option('--cache', default=None, type=click.Path(path_type=pathlib.Path), help='The SQLite file caching results by content hash.')
+def analyze_readmes(source, output, extractors, pattern, id_key, readme_key, worker_number, timeout, cache):
+    from younger.commons.batch import iterate_readmes, analyze_readmes
+
+    readmes = iterate_readmes(source, pattern=pattern, id_key=id_key, readme_key=readme_key)
+    statistics = analyze_readmes(readmes, output, extractors=tuple(extractors.split(',')), worker_number=worker_number, timeout=timeout, cache_filepath=cache)
+    click.echo(', '.join(f'{status}: {number}' for status, number in statistics.items()))
+
+
+@commons.command(name='benchmark')
+@click.option('--names', default=None, help='Comma-separated benchmarks to run. Defaults to all of them.')
+@click.option('--scales', default='small', show_default=True, help='Comma-separated scales of the synthetic data (small, medium, large).')
+@click.option('--repeat', default=5, type=int, show_default=True, help='The number of measured runs of each benchmark.')
+@click.option('--warmup', default=1, type=int, show_default=True, help='The number of unmeasured runs before the measured ones.')
+@click.option('--output', default=None, type=click.Path(dir_okay=False, path_type=pathlib.Path), help='The JSON file the results are saved into.')
+@click.option('--baseline', default=None, type=click.Path(exists=True, dir_okay=False, path_type=pathlib.Path), help='The JSON file of baseline results to compare against.')
+@click.option('--threshold', default=0.1, type=float, show_default=True, help='The relative slowdown of the median over the baseline counted as a regression.')
+@click.pass_context
+def benchmark(ctx, names, scales, repeat, warmup, output, baseline, threshold):
+    from younger.commons.benchmark import run_benchmarks, save_benchmark_results, load_benchmark_results, compare_benchmark_results
+
+    def report(result):
+        click.echo(f'{result["name"]:<24} {result["scale"]:<8} median {result["median"] * 1000:10.3f} ms  min {result["min"] * 1000:10.3f} ms')
+
+    benchmark_results = run_benchmarks(
+        names=None if names is None else names.split(','),
+        scales=scales.split(','),
+        repeat=repeat, warmup=warmup,
+        callback=report,
+    )
+    if output is not None:
+        save_benchmark_results(benchmark_results, output)
+
+    if baseline is not None:
+        comparisons = compare_benchmark_results(benchmark_results, load_benchmark_results(baseline), threshold=threshold)
+        click.echo('')
+        for comparison in comparisons:
+            ratio = 'N/A' if comparison['ratio'] is None else f'{comparison["ratio"]:.3f}x'
+            click.echo(f'{comparison["name"]:<24} {comparison["scale"]:<8} {ratio:>8}  {"REGRESSED" if comparison["regressed"] else "OK"}')
+        regressions = [comparison for comparison in comparisons if comparison['regressed']]
+        if len(regressions) != 0:
+            click.echo(f'{len(regressions)} Benchmark(s) Regressed Over {threshold:.0%}.', err=True)
+            ctx.exit(1)
@@ -15,14 +15,23 @@
 
 
 import click
+import pathlib
 
 from younger.commands.logics import logics
 from younger.commands.tools import tools
 from younger.commands.apps import apps
+from younger.commands.commons import commons
 
 
 @click.group(name='younger')
-def main():
+@click.option('--profile', is_flag=True, help='Profile the subcommand with cProfile, print the hotspots and dump the statistics (*.prof).')
+@click.option('--trace-memory', is_flag=True, help='Trace the memory allocations of the subcommand with tracemalloc, print the top allocation sites and dump the snapshot (*.tracemalloc).')
+@click.option('--profile-dirpath', default='.', type=click.Path(file_okay=False, path_type=pathlib.Path), show_default=True, help='The directory the profiling results are dumped into.')
+@click.option('--profile-top', default=30, type=int, show_default=True, help='The number of entries printed in each profiling summary.')
+@click.option('--profile-sort', default='cumulative', type=click.Choice(['cumulative', 'tottime', 'calls', 'ncalls', 'filename', 'name']), show_default=True, help='The key the CPU hotspots are sorted by.')
+@click.option('--metrics', default=None, type=click.Path(dir_okay=False, path_type=pathlib.Path), help='Collect the I/O metrics of the subcommand and export them into this file, in the Prometheus text format if it ends with \'.prom\', as JSON otherwise.')
+@click.pass_context
+def main(ctx, profile, trace_memory, profile_dirpath, profile_top, profile_sort, metrics):
     # naive_log(
     #     f'                                                                \n'
     #     f'                >   Welcome to use Younger!   <                 \n'
@@ -35,12 +44,20 @@ def main():
     #     f'                                                                \n'
     # )
     # print(main.commands['logics'].commands['ir'].__dict__)
-    pass
+    if profile or trace_memory:
+        from younger.commons.profiling import profiling
+        # The profiling context is exited when the context closes, that is, after the subcommand (built-in or plugin) has finished.
+        ctx.with_resource(profiling(profile_dirpath, name=f'younger-{ctx.invoked_subcommand}', cpu=profile, memory=trace_memory, top=profile_top, sort_key=profile_sort))
+    if metrics is not None:
+        from younger.commons.metrics import set_metrics_enabled, export_metrics
+        set_metrics_enabled(True)
+        ctx.call_on_close(lambda: export_metrics(metrics))
 
 
 main.add_command(logics, name='logics')
 main.add_command(tools, name='tools')
 main.add_command(apps, name='apps')
+main.add_command(commons, name='commons')
 
 
 if __name__ == '__main__':
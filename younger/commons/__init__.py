@@ -14,10 +14,33 @@
 ########################################################################
 
 
-from . import cache
-from . import constants
-from . import download
-from . import hash
-from . import io
-from . import logging
-from . import version
+import importlib
+
+
+__all__ = [
+    'batch',
+    'benchmark',
+    'cache',
+    'configure',
+    'constants',
+    'download',
+    'hash',
+    'io',
+    'logging',
+    'metrics',
+    'profiling',
+    'store',
+    'string',
+    'version',
+]
+
+
+# Submodules are imported on first access (PEP 562), so that e.g. 'younger.commons.hash' does not pull in the dependencies of 'younger.commons.download'.
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
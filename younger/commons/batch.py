@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 13:20:05
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 13:20:05
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import os
+import json
+import time
+import pathlib
+import sqlite3
+import traceback
+import multiprocessing
+import multiprocessing.connection
+
+from typing import Any, Callable, Iterable, Iterator, Literal
+
+from younger.commons.io import create_dir, get_system_depend_path
+from younger.commons.hash import hash_strings
+from younger.commons.string import README_EXTRACTORS, scan_readme_string
+from younger.commons.logging import logger
+from younger.commons.configure import get_config
+
+
+def process_pool_worker(function: Callable, connection: multiprocessing.connection.Connection) -> None:
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        key, argument = task
+        try:
+            connection.send((key, 'ok', function(argument)))
+        except Exception:
+            connection.send((key, 'error', traceback.format_exc()))
+
+
+class ProcessPoolWorker(object):
+    def __init__(self, function: Callable, context: multiprocessing.context.BaseContext):
+        self.connection, worker_connection = context.Pipe(duplex=True)
+        self.process = context.Process(target=process_pool_worker, args=(function, worker_connection), daemon=True)
+        self.process.start()
+        worker_connection.close()
+        self.busy = False
+        self.key = None
+        self.deadline = None
+
+    def submit(self, key: Any, argument: Any, timeout: float | None) -> None:
+        self.busy = True
+        self.key = key
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.connection.send((key, argument))
+
+    def release(self) -> None:
+        self.busy = False
+        self.key = None
+        self.deadline = None
+
+    def close(self, kill: bool = False) -> None:
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.connection.send(None)
+            except OSError:
+                pass
+        self.process.join()
+        self.connection.close()
+
+
+def process_pool_imap(
+    function: Callable,
+    tasks: Iterable[tuple[Any, Any]],
+    worker_number: int | None = None,
+    timeout: float | None = None,
+) -> Iterator[tuple[Any, Literal['ok', 'error', 'timeout'], Any]]:
+    r"""Applies 'function' to the argument of every (key, argument) task on a pool of processes, yielding (key, status, result) as tasks complete.
+
+    Tasks are pulled from 'tasks' lazily, one per idle worker, so arbitrarily long task streams are not buffered.
+    A task running longer than 'timeout' seconds has its worker killed and replaced, and is reported with status 'timeout';
+    a task raising an exception is reported with status 'error' and the formatted traceback as result.
+    'function' must be picklable (defined at module level).
+    """
+    worker_number = worker_number or get_config().pool.worker_number or os.cpu_count() or 1
+    assert 0 < worker_number, f'Worker Number Must Be Positive, Got {worker_number}.'
+    context = multiprocessing.get_context()
+    workers = [ProcessPoolWorker(function, context) for _ in range(worker_number)]
+    tasks = iter(tasks)
+    exhausted = False
+    try:
+        while True:
+            for worker in workers:
+                if worker.busy or exhausted:
+                    continue
+                try:
+                    key, argument = next(tasks)
+                except StopIteration:
+                    exhausted = True
+                    break
+                worker.submit(key, argument, timeout)
+
+            busy_workers = [worker for worker in workers if worker.busy]
+            if len(busy_workers) == 0:
+                break
+
+            deadlines = [worker.deadline for worker in busy_workers if worker.deadline is not None]
+            wait_timeout = None if len(deadlines) == 0 else max(0, min(deadlines) - time.monotonic())
+            ready_connections = multiprocessing.connection.wait([worker.connection for worker in busy_workers], timeout=wait_timeout)
+
+            for index, worker in enumerate(workers):
+                if not worker.busy:
+                    continue
+                if worker.connection in ready_connections:
+                    try:
+                        key, status, result = worker.connection.recv()
+                    except EOFError:
+                        worker.close(kill=True)
+                        key, status, result = worker.key, 'error', f'Worker Process Exited With Code {worker.process.exitcode}.'
+                        workers[index] = ProcessPoolWorker(function, context)
+                    worker.release()
+                    yield key, status, result
+                    continue
+                if worker.deadline is not None and worker.deadline <= time.monotonic():
+                    key = worker.key
+                    worker.close(kill=True)
+                    workers[index] = ProcessPoolWorker(function, context)
+                    yield key, 'timeout', None
+    finally:
+        for worker in workers:
+            worker.close(kill=worker.busy)
+
+
+def iterate_readmes_from_dirpath(dirpath: pathlib.Path | str, pattern: str = '*.md') -> Iterator[tuple[str, str]]:
+    r"""Yields (id, readme) for every file under 'dirpath' matching 'pattern', the id is the path relative to 'dirpath'."""
+    dirpath = get_system_depend_path(dirpath)
+    for filepath in sorted(dirpath.rglob(pattern)):
+        if filepath.is_file():
+            yield str(filepath.relative_to(dirpath)), filepath.read_text(encoding='utf-8', errors='replace')
+
+
+def iterate_readmes_from_jsonl(filepath: pathlib.Path | str, id_key: str = 'id', readme_key: str = 'readme') -> Iterator[tuple[str, str]]:
+    r"""Yields (id, readme) for every line of a JSONL file, the id defaults to the line number if 'id_key' is absent."""
+    filepath = get_system_depend_path(filepath)
+    with open(filepath, 'r', encoding='utf-8') as file:
+        for line_number, line in enumerate(file):
+            if line.strip() == '':
+                continue
+            record = json.loads(line)
+            yield str(record.get(id_key, line_number)), record[readme_key]
+
+
+def iterate_readmes(source: pathlib.Path | str, pattern: str = '*.md', id_key: str = 'id', readme_key: str = 'readme') -> Iterator[tuple[str, str]]:
+    source = get_system_depend_path(source)
+    if source.is_dir():
+        return iterate_readmes_from_dirpath(source, pattern=pattern)
+    else:
+        return iterate_readmes_from_jsonl(source, id_key=id_key, readme_key=readme_key)
+
+
+class ReadmeResultCache(object):
+    r"""Results of README analyses, keyed by the hash of the README content and the selected extractors, stored in SQLite."""
+    def __init__(self, cache_filepath: pathlib.Path | str):
+        cache_filepath = get_system_depend_path(cache_filepath)
+        create_dir(cache_filepath.parent)
+        self._connection = sqlite3.connect(cache_filepath)
+        self._connection.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, result TEXT NOT NULL)')
+        self._connection.commit()
+
+    def get(self, key: str) -> dict | None:
+        row = self._connection.execute('SELECT result FROM results WHERE key = ?', (key,)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def put(self, key: str, result: dict) -> None:
+        self._connection.execute('INSERT OR REPLACE INTO results (key, result) VALUES (?, ?)', (key, json.dumps(result)))
+
+    def commit(self) -> None:
+        self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.commit()
+        self._connection.close()
+
+
+def analyze_readme(argument: tuple[str, tuple[str, ...]]) -> dict[str, Any]:
+    readme, extractors = argument
+    return scan_readme_string(readme, extractors=extractors)
+
+
+def analyze_readmes(
+    readmes: Iterable[tuple[str, str]],
+    output_filepath: pathlib.Path | str,
+    extractors: list[str] | tuple[str, ...] = README_EXTRACTORS,
+    worker_number: int | None = None,
+    timeout: float | None = 60,
+    cache_filepath: pathlib.Path | str | None = None,
+) -> dict[str, int]:
+    r"""Analyzes a stream of (id, readme) on a pool of processes, and writes one JSON line per README to 'output_filepath' as soon as it is done.
+
+    Each line is {"id": ..., "status": "ok"|"error"|"timeout", "results": {...}} (see :func:`scan_readme_string`), or carries "error" instead of "results".
+    A README taking longer than 'timeout' seconds is abandoned, so pathological inputs cannot stall the pool.
+    If 'cache_filepath' is given, results are cached by content hash and unchanged READMEs are not analyzed again on reruns.
+
+    Returns:
+        dict[str, int]: The number of READMEs per status, and the number of cache hits under 'cached'.
+    """
+    assert all(extractor in README_EXTRACTORS for extractor in extractors), f'Not Support The Extractors - {set(extractors) - set(README_EXTRACTORS)}.'
+    extractors = tuple(extractors)
+    output_filepath = get_system_depend_path(output_filepath)
+    create_dir(output_filepath.parent)
+
+    cache = None if cache_filepath is None else ReadmeResultCache(cache_filepath)
+    statistics = dict(ok=0, error=0, timeout=0, cached=0)
+
+    with open(output_filepath, 'w', encoding='utf-8') as output_file:
+        def write(readme_id: str, status: str, value: Any) -> None:
+            record = dict(id=readme_id, status=status)
+            record['results' if status == 'ok' else 'error'] = value
+            output_file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            statistics[status] += 1
+
+        def tasks() -> Iterator[tuple[tuple[str, str | None], tuple[str, tuple[str, ...]]]]:
+            for readme_id, readme in readmes:
+                if not isinstance(readme, str):
+                    write(readme_id, 'error', f'README Is Not A String But \'{type(readme).__name__}\'.')
+                    continue
+                if cache is None:
+                    yield (readme_id, None), (readme, extractors)
+                    continue
+                key = hash_strings([','.join(extractors), '\n', readme])
+                results = cache.get(key)
+                if results is None:
+                    yield (readme_id, key), (readme, extractors)
+                else:
+                    write(readme_id, 'ok', results)
+                    statistics['cached'] += 1
+
+        try:
+            for index, ((readme_id, key), status, value) in enumerate(process_pool_imap(analyze_readme, tasks(), worker_number=worker_number, timeout=timeout), start=1):
+                if status == 'timeout':
+                    value = f'Timeout After {timeout} Seconds.'
+                    logger.warning(f'README \'{readme_id}\' Timeout After {timeout} Seconds.')
+                write(readme_id, status, value)
+                if cache is not None and status == 'ok':
+                    cache.put(key, value)
+                if index % 1000 == 0:
+                    output_file.flush()
+                    if cache is not None:
+                        cache.commit()
+        finally:
+            if cache is not None:
+                cache.close()
+
+    return statistics
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 17:20:46
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 17:20:46
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import sys
+import time
+import random
+import pathlib
+import platform
+import tempfile
+import itertools
+import statistics
+
+from typing import Any, Callable
+
+from younger.commons.io import create_dir, load_json, save_json, load_pickle, save_pickle, tar_archive, get_dir_size, get_system_depend_path
+from younger.commons.hash import hash_file
+from younger.commons.cache import CachedChunks
+from younger.commons.string import scan_readme_string
+
+
+BENCHMARK_SCALES = dict(
+    small = 1,
+    medium = 10,
+    large = 100,
+)
+
+BENCHMARKS: dict[str, Callable[[pathlib.Path, int], tuple[Callable[[], Any], int]]] = dict()
+
+
+def register_benchmark(name: str) -> Callable:
+    r"""Registers a benchmark under 'name'.
+
+    A benchmark is a function of (workspace dirpath, scale) preparing its synthetic data, and returning the function to time,
+    together with the number of bytes (or items) it processes per call, from which the throughput is derived.
+    """
+    def decorator(setup: Callable[[pathlib.Path, int], tuple[Callable[[], Any], int]]):
+        assert name not in BENCHMARKS, f'Benchmark \'{name}\' Is Already Registered.'
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+def generate_objects(number: int, seed: int = 0) -> list[dict]:
+    generator = random.Random(seed)
+    return [dict(id=index, name=f'node_{index}', value=generator.random(), shape=[generator.randint(1, 512) for _ in range(4)]) for index in range(number)]
+
+
+def generate_bytes(size: int, seed: int = 0) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+def generate_files(dirpath: pathlib.Path, number: int, size: int, seed: int = 0) -> None:
+    r"""Writes 'number' files of 'size' random bytes, spread over subdirectories of at most 100 files."""
+    for index in range(number):
+        filepath = dirpath.joinpath(f'{index // 100}', f'{index}.bin')
+        create_dir(filepath.parent)
+        filepath.write_bytes(generate_bytes(size, seed=seed + index))
+
+
+def generate_readme(number_of_sections: int, seed: int = 0) -> str:
+    generator = random.Random(seed)
+    lines = ['---', 'license: apache-2.0', 'date: 2024-12-27', '---']
+    for index in range(number_of_sections):
+        lines.extend([
+            f'## Section {index}',
+            f'Trained on {2000 + index % 25}/{1 + index % 12:02d}/{1 + index % 28:02d} 10:{index % 60:02d} for {generator.randint(1, 100)} epochs, +{generator.random():.2f}% over baseline.',
+            '',
+            '| Metric | Value | Delta |',
+            '|:-------|:-----:|------:|',
+            *[f'| metric_{row} | {generator.random():.4f} | {generator.random() - 0.5:+.3f} |' for row in range(5)],
+            '',
+        ])
+    return '\n'.join(lines)
+
+
+@register_benchmark('save_pickle')
+def benchmark_save_pickle(dirpath: pathlib.Path, scale: int) -> tuple[Callable[[], Any], int]:
+    objects = generate_objects(10000 * scale)
+    filepath = dirpath.joinpath('objects.pkl')
+    save_pickle(objects, filepath)
+    return lambda: save_pickle(objects, filepath), filepath.stat().st_size
+
+
+@register_benchmark('load_pickle')
+def benchmark_load_pickle(dirpath: pathlib.Path, scale: int) -> tuple[Callable[[], Any], int]:
+    filepath = dirpath.joinpath('objects.pkl')
+    save_pickle(generate_objects(10000 * scale), filepath)
+    return lambda: load_pickle(filepath), filepath.stat().st_size
+
+
+@register_benchmark('hash_file')
+def benchmark_hash_file(dirpath: pathlib.Path, scale: int) -> tuple[Callable[[], Any], int]:
+    filepath = dirpath.joinpath('data.bin')
+    filepath.write_bytes(generate_bytes(4 * 1024 * 1024 * scale))
+    return lambda: hash_file(filepath), filepath.stat().st_size
+
+
+@register_benchmark('cached_chunks_build')
+def benchmark_cached_chunks_build(dirpath: pathlib.Path, scale: int) -> tuple[Callable[[], Any], int]:
+    objects = generate_objects(10000 * scale)
+    counter = itertools.count()
+    return lambda: CachedChunks(dirpath.joinpath(f'chunks_{next(counter)}'), iter(objects), 1000), len(objects)
+
+
+@register_benchmark('cached_chunks_iterate')
+def benchmark_cached_chunks_iterate(dirpath: pathlib.Path, scale: int) -> tuple[Callable[[], Any], int]:
+    objects = generate_objects(10000 * scale)
+    CachedChunks(dirpath.joinpath('chunks'), iter(objects), 1000)
+    def iterate():
+        # A fresh instance over the same cache, rewound to the first chunk.
+        cached_chunks = CachedChunks(dirpath.joinpath('chunks'), iter(()), 1000)
+        cached_chunks.rewind()
+        for _ in cached_chunks:
+            pass
+    return iterate, len(objects)
+
+
+@register_benchmark('cached_chunks_iter_batches')
+def benchmark_cached_chunks_iter_batches(dirpath: pathlib.Path, scale: int) -> tuple[Callable[[], Any], int]:
+    objects = generate_objects(10000 * scale)
+    CachedChunks(dirpath.joinpath('chunks'), iter(objects), 1000, schema=dict(id='q', name='str', value='d'))
+    def iterate():
+        cached_chunks = CachedChunks(dirpath.joinpath('chunks'), iter(()), 1000)
+        cached_chunks.rewind()
+        for _ in cached_chunks.iter_batches():
+            pass
+    return iterate, len(objects)
+
+
+@register_benchmark('get_dir_size')
+def benchmark_get_dir_size(dirpath: pathlib.Path, scale: int) -> tuple[Callable[[], Any], int]:
+    generate_files(dirpath.joinpath('files'), 500 * scale, 128)
+    return lambda: get_dir_size(dirpath.joinpath('files')), 500 * scale
+
+
+@register_benchmark('tar_archive')
+def benchmark_tar_archive(dirpath: pathlib.Path, scale: int) -> tuple[Callable[[], Any], int]:
+    generate_files(dirpath.joinpath('files'), 100 * scale, 16 * 1024)
+    return lambda: tar_archive(dirpath.joinpath('files'), dirpath.joinpath('files.tar.gz')), get_dir_size(dirpath.joinpath('files'))
+
+
+@register_benchmark('scan_readme_string')
+def benchmark_scan_readme_string(dirpath: pathlib.Path, scale: int) -> tuple[Callable[[], Any], int]:
+    readme = generate_readme(50 * scale)
+    return lambda: scan_readme_string(readme), len(readme.encode('utf-8'))
+
+
+def run_benchmark(name: str, scale: str = 'small', repeat: int = 5, warmup: int = 1) -> dict[str, Any]:
+    r"""Runs the benchmark 'name' on synthetic data of 'scale', 'warmup' + 'repeat' times, each in the same fresh workspace.
+
+    Returns:
+        dict[str, Any]: The timings (in seconds) of the measured runs, with their minimum, median and mean, and the median throughput (per second).
+    """
+    assert name in BENCHMARKS, f'Not Support The Benchmark - \'{name}\'.'
+    assert scale in BENCHMARK_SCALES, f'Not Support The Scale - \'{scale}\'.'
+    assert 0 < repeat, f'The Number Of Repeats Must Be Positive.'
+
+    with tempfile.TemporaryDirectory(prefix=f'younger-benchmark-{name}-') as dirpath:
+        function, amount = BENCHMARKS[name](pathlib.Path(dirpath), BENCHMARK_SCALES[scale])
+        for _ in range(warmup):
+            function()
+        timings = list()
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start_time)
+
+    median = statistics.median(timings)
+    return dict(
+        name=name, scale=scale, repeat=repeat,
+        timings=timings, min=min(timings), median=median, mean=statistics.mean(timings),
+        amount=amount, throughput=amount / median if 0 < median else None,
+    )
+
+
+def run_benchmarks(names: list[str] | None = None, scales: list[str] | None = None, repeat: int = 5, warmup: int = 1, callback: Callable[[dict], None] | None = None) -> dict[str, Any]:
+    r"""Runs the benchmarks 'names' (all by default) at every scale of 'scales' (['small'] by default), 'callback' is called with each result as soon as it is available."""
+    names = list(BENCHMARKS) if names is None else names
+    scales = ['small'] if scales is None else scales
+    results = list()
+    for scale in scales:
+        for name in names:
+            result = run_benchmark(name, scale=scale, repeat=repeat, warmup=warmup)
+            results.append(result)
+            if callback is not None:
+                callback(result)
+
+    return dict(
+        environment=dict(python=sys.version.split()[0], implementation=platform.python_implementation(), platform=platform.platform(), machine=platform.machine(), time=time.strftime('%Y-%m-%d %H:%M:%S')),
+        results=results,
+    )
+
+
+def save_benchmark_results(benchmark_results: dict[str, Any], filepath: pathlib.Path | str) -> None:
+    save_json(benchmark_results, get_system_depend_path(filepath), indent=2)
+
+
+def load_benchmark_results(filepath: pathlib.Path | str) -> dict[str, Any]:
+    return load_json(get_system_depend_path(filepath))
+
+
+def compare_benchmark_results(benchmark_results: dict[str, Any], baseline_results: dict[str, Any], threshold: float = 0.1) -> list[dict[str, Any]]:
+    r"""Compares the median timings of 'benchmark_results' against 'baseline_results', benchmark by benchmark and scale by scale.
+
+    A benchmark regresses if its median is more than 'threshold' (relative, e.g. 0.1 for 10%) slower than that of the baseline.
+    Benchmarks missing from the baseline are reported with a ratio of None and never regress.
+
+    Returns:
+        list[dict[str, Any]]: One comparison (name, scale, median, baseline, ratio, regressed) per benchmark of 'benchmark_results'.
+    """
+    assert 0 <= threshold, f'The Threshold Must Be Non-Negative.'
+    baseline_medians = {(result['name'], result['scale']): result['median'] for result in baseline_results['results']}
+    comparisons = list()
+    for result in benchmark_results['results']:
+        baseline_median = baseline_medians.get((result['name'], result['scale']), None)
+        ratio = None if baseline_median is None or baseline_median == 0 else result['median'] / baseline_median
+        comparisons.append(dict(
+            name=result['name'], scale=result['scale'],
+            median=result['median'], baseline=baseline_median,
+            ratio=ratio, regressed=ratio is not None and 1 + threshold < ratio,
+        ))
+    return comparisons
@@ -14,17 +14,24 @@
 ########################################################################
 
 
-import tqdm
+import os
+import time
+import array
+import pickle
+import itertools
+import shutil
 import pathlib
 
 
-from typing import Iterator
+from typing import Any, Callable, Iterator, Literal
 
-from younger.commons.io import load_pickle, save_pickle
-from younger.commons.constants import YoungerHandle
+from younger.commons.io import create_dir, lock_file, load_pickle, save_pickle
+from younger.commons.logging import logger
+from younger.commons.metrics import increase_counter, observe_histogram
+from younger.commons.configure import get_config
 
 
-CACHE_ROOT: pathlib.Path = pathlib.Path.home().joinpath(f'.cache/{YoungerHandle.MainName}')
+CACHE_ROOT: pathlib.Path | None = None
 
 
 def set_cache_root(dirpath: pathlib.Path) -> None:
@@ -35,60 +42,305 @@ def set_cache_root(dirpath: pathlib.Path) -> None:
 
 
 def get_cache_root() -> pathlib.Path:
-    return CACHE_ROOT
+    # Defaults to the configured cache root (see younger.commons.configure).
+    return get_config().cache.root if CACHE_ROOT is None else CACHE_ROOT
+
+
+COLUMN_TYPES = ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q', 'f', 'd', 'str')
+
+
+class StringColumn(object):
+    r"""A read-only column of strings, stored as UTF-8 bytes and their offsets, the strings are decoded on access."""
+    def __init__(self, offsets: memoryview, data: bytes):
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        index = index + len(self) if index < 0 else index
+        if not 0 <= index < len(self):
+            raise IndexError('StringColumn Index Out Of Range.')
+        return self._data[self._offsets[index]:self._offsets[index + 1]].decode('utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self._data[self._offsets[index]:self._offsets[index + 1]].decode('utf-8')
+
+    def tolist(self) -> list[str]:
+        return list(self)
+
+
+def encode_columns(records: list[Any], schema: dict[str, str]) -> dict[str, bytes]:
+    r"""Encodes records (mappings, or sequences in the order of 'schema') into one buffer per column."""
+    columns = dict()
+    for index, (name, column_type) in enumerate(schema.items()):
+        values = [record[name] if isinstance(record, dict) else record[index] for record in records]
+        if column_type == 'str':
+            encoded_values = [value.encode('utf-8') for value in values]
+            data = b''.join(encoded_values)
+            offsets_type = 'I' if len(data) < 2 ** 32 else 'Q'
+            offsets = array.array(offsets_type, [0])
+            offsets.extend(itertools.accumulate(len(encoded_value) for encoded_value in encoded_values))
+            columns[name] = (offsets_type, offsets.tobytes(), data)
+        else:
+            columns[name] = array.array(column_type, values).tobytes()
+    return columns
+
+
+def decode_columns(columns: dict[str, bytes], schema: dict[str, str]) -> dict[str, memoryview | StringColumn]:
+    r"""Views the buffers of a columnar chunk as typed columns, without copying them."""
+    views = dict()
+    for name, column_type in schema.items():
+        if column_type == 'str':
+            offsets_type, offsets, data = columns[name]
+            views[name] = StringColumn(memoryview(offsets).cast(offsets_type), data)
+        else:
+            views[name] = memoryview(columns[name]).cast(column_type)
+    return views
+
+
+def publish_dir(build_dirpath: pathlib.Path, dirpath: pathlib.Path, last_filename: str) -> None:
+    r"""Publishes the directory 'build_dirpath' as 'dirpath' with an atomic rename.
+
+    An existing 'dirpath' (e.g. a leftover of an unsafe build) can not be replaced by a rename, so the files are moved into it instead, 'last_filename' last.
+    """
+    if not dirpath.exists():
+        os.rename(build_dirpath, dirpath)
+    else:
+        last_filepath = build_dirpath.joinpath(last_filename)
+        for filepath in build_dirpath.iterdir():
+            if filepath != last_filepath:
+                os.replace(filepath, dirpath.joinpath(filepath.name))
+        os.replace(last_filepath, dirpath.joinpath(last_filename))
+        os.rmdir(build_dirpath)
+
+
+def get_function_identity(function: Callable) -> bytes | str:
+    # Picklable functions are pickled by reference, i.e. by their qualified names, with the arguments of partials; others fall back on their qualified names.
+    try:
+        return pickle.dumps(function)
+    except Exception:
+        return f'{getattr(function, "__module__", None)}.{getattr(function, "__qualname__", repr(function))}'
+
+
+def transform_chunk(argument: tuple[Callable, Literal['map', 'filter'], pathlib.Path, dict[str, str] | None, pathlib.Path, dict[str, str] | None]) -> int:
+    r"""Applies 'function' to the records of a source chunk and saves the output chunk atomically. Returns the number of output records."""
+    function, kind, source_filepath, source_schema, output_filepath, output_schema = argument
+    chunk = load_pickle(source_filepath)
+    if source_schema is not None:
+        columns = decode_columns(chunk, source_schema)
+        chunk = [dict(zip(columns.keys(), values)) for values in zip(*columns.values())]
+
+    if kind == 'map':
+        output_chunk = [function(item) for item in chunk]
+    else:
+        output_chunk = [item for item in chunk if function(item)]
+
+    temp_filepath = output_filepath.with_name(f'.{output_filepath.name}.{os.getpid()}')
+    save_pickle(output_chunk if output_schema is None else encode_columns(output_chunk, output_schema), temp_filepath)
+    os.replace(temp_filepath, output_filepath)
+    return len(output_chunk)
 
 
 class CachedChunks(object):
+    r"""Caches the items of an iterator on disk in chunks of 'size_of_chunk' items, and iterates over the chunks, resuming from the last unfinished one.
+
+    The cache is built exactly once per 'cache_dirpath', even if several processes start at the same time:
+    the first process takes an inter-process lock next to 'cache_dirpath', builds the cache in a temporary directory and publishes it with an atomic rename,
+    while the other processes wait for the lock, find the published cache and just load it (their iterators are not consumed).
+    Since 'config' is always published last, a cache with a 'config' is complete, and readers never see a half-written cache.
+
+    If 'schema' is given (column name -> 'array' typecode, or 'str'), the records (mappings, or sequences in the order of 'schema') are stored column by column,
+    each column of a chunk as one contiguous buffer, instead of as pickled Python objects. The schema is recorded in 'config'.
+    Columnar chunks are smaller and much faster to load, and :meth:`iter_batches` yields their columns as views (memoryview, or :class:`StringColumn`) without per-record objects;
+    iterating over the chunks themselves still yields lists of records, as dicts.
+
+    :meth:`map` and :meth:`filter` derive a new CachedChunks from this one on a pool of processes, chunk by chunk, and resume an interrupted run.
+    """
     _status_cache_filename_ = 'status'
     _config_cache_filename_ = 'config'
     _chunks_cache_filename_ = 'chunks'
-    def __init__(self, cache_dirpath: pathlib.Path, iterator: Iterator, size_of_chunk: int):
+    def __init__(self, cache_dirpath: pathlib.Path, iterator: Iterator, size_of_chunk: int, schema: dict[str, str] | None = None):
+        assert schema is None or (0 < len(schema) and all(column_type in COLUMN_TYPES for column_type in schema.values())), f'Not Support The Schema - {schema}, The Column Types Must Be In {COLUMN_TYPES}.'
         self._cache_dirpath = cache_dirpath
         self._status_filepath = self._cache_dirpath.joinpath(self.__class__._status_cache_filename_)
         self._config_filepath = self._cache_dirpath.joinpath(self.__class__._config_cache_filename_)
         self._chunks_filepath = self._cache_dirpath.joinpath(self.__class__._chunks_cache_filename_)
 
-        if self._config_filepath.is_file():
-            config = load_pickle(self._config_filepath)
-            self._size_of_chunk = config['size_of_chunk']
-            self._length_of_itr = config['length_of_itr']
-            self._num_of_chunks = config['num_of_chunks']
+        if not self._config_filepath.is_file():
+            with lock_file(self._cache_dirpath.with_name(f'.{self._cache_dirpath.name}.lock')):
+                # Another process may have published the cache while this one was waiting for the lock.
+                if not self._config_filepath.is_file():
+                    self._build(iterator, size_of_chunk, schema)
 
-            self._current_index = load_pickle(self._status_filepath)
-        else:
-            self._size_of_chunk = size_of_chunk
-            self._length_of_itr = 0
-            self._num_of_chunks = 0
+        config = load_pickle(self._config_filepath)
+        self._size_of_chunk = config['size_of_chunk']
+        self._length_of_itr = config['length_of_itr']
+        self._num_of_chunks = config['num_of_chunks']
+        self._schema = config.get('schema', None)
+        # Caches built before the lengths of chunks were recorded only have full chunks but the last one.
+        chunk_lengths = config.get('chunk_lengths', None)
+        if chunk_lengths is None:
+            chunk_lengths = [min(self._size_of_chunk, self._length_of_itr - chunk_id * self._size_of_chunk) for chunk_id in range(self._num_of_chunks)]
+        self._chunk_positions = [0, *itertools.accumulate(chunk_lengths)]
+        assert schema is None or schema == self._schema, f'The Schema {schema} Differs From That Of The Cache - {self._schema}.'
+
+        self._current_index = load_pickle(self._status_filepath) if self._status_filepath.is_file() else 0
 
-            self._current_index = 0
+    def _build(self, iterator: Iterator, size_of_chunk: int, schema: dict[str, str] | None) -> None:
+        import tqdm
 
+        # Only the lock holder builds, so a leftover of an interrupted build can be removed safely.
+        build_dirpath = self._cache_dirpath.with_name(f'.{self._cache_dirpath.name}.build')
+        shutil.rmtree(build_dirpath, ignore_errors=True)
+        create_dir(build_dirpath)
+        chunks_filepath = build_dirpath.joinpath(self.__class__._chunks_cache_filename_)
+
+        try:
+            length_of_itr = 0
+            num_of_chunks = 0
+            chunk_lengths = list()
             chunk = list()
             for item in tqdm.tqdm(iterator):
                 chunk.append(item)
-                if len(chunk) == self._size_of_chunk:
-                    save_pickle(chunk, self._chunks_filepath.with_suffix(f'.{self._num_of_chunks}'))
+                if len(chunk) == size_of_chunk:
+                    save_pickle(chunk if schema is None else encode_columns(chunk, schema), chunks_filepath.with_suffix(f'.{num_of_chunks}'))
+                    chunk_lengths.append(len(chunk))
                     chunk.clear()
-                    self._num_of_chunks += 1
-                self._length_of_itr += 1
+                    num_of_chunks += 1
+                length_of_itr += 1
 
             if len(chunk) != 0:
-                save_pickle(chunk, self._chunks_filepath.with_suffix(f'.{self._num_of_chunks}'))
-                self._num_of_chunks += 1
+                save_pickle(chunk if schema is None else encode_columns(chunk, schema), chunks_filepath.with_suffix(f'.{num_of_chunks}'))
+                chunk_lengths.append(len(chunk))
+                num_of_chunks += 1
 
             config = dict(
-                size_of_chunk = self._size_of_chunk,
-                length_of_itr = self._length_of_itr,
-                num_of_chunks = self._num_of_chunks,
+                size_of_chunk = size_of_chunk,
+                length_of_itr = length_of_itr,
+                num_of_chunks = num_of_chunks,
+                chunk_lengths = chunk_lengths,
+                schema = schema,
             )
-            save_pickle(config, self._config_filepath)
-            save_pickle(self._current_index, self._status_filepath)
+            save_pickle(0, build_dirpath.joinpath(self.__class__._status_cache_filename_))
+            save_pickle(config, build_dirpath.joinpath(self.__class__._config_cache_filename_))
+
+            publish_dir(build_dirpath, self._cache_dirpath, self.__class__._config_cache_filename_)
+        except BaseException as exception:
+            shutil.rmtree(build_dirpath, ignore_errors=True)
+            raise exception
+
+    def _transform(self, function: Callable, kind: Literal['map', 'filter'], cache_dirpath: pathlib.Path, worker_number: int | None, schema: dict[str, str] | None, version: str | None) -> 'CachedChunks':
+        from younger.commons.batch import process_pool_imap
+
+        config_filepath = cache_dirpath.joinpath(self.__class__._config_cache_filename_)
+        if not config_filepath.is_file():
+            with lock_file(cache_dirpath.with_name(f'.{cache_dirpath.name}.lock')):
+                if not config_filepath.is_file():
+                    # Unlike a build, a stage is kept when interrupted: its completed chunks are recorded by 'done.<chunk id>' files and are skipped on resumption.
+                    stage_dirpath = cache_dirpath.with_name(f'.{cache_dirpath.name}.stage')
+                    stage_filepath = stage_dirpath.joinpath('stage')
+                    stage = dict(source_dirpath=str(self._cache_dirpath.absolute()), num_of_chunks=self._num_of_chunks, kind=kind, function=get_function_identity(function), version=version, schema=schema)
+                    if not stage_filepath.is_file() or load_pickle(stage_filepath) != stage:
+                        shutil.rmtree(stage_dirpath, ignore_errors=True)
+                        create_dir(stage_dirpath)
+                        save_pickle(stage, stage_filepath)
+
+                    chunks_filepath = stage_dirpath.joinpath(self.__class__._chunks_cache_filename_)
+                    lengths = dict()
+                    for chunk_id in range(self._num_of_chunks):
+                        done_filepath = stage_dirpath.joinpath(f'done.{chunk_id}')
+                        if done_filepath.is_file():
+                            lengths[chunk_id] = load_pickle(done_filepath)
+
+                    tasks = (
+                        (chunk_id, (function, kind, self._chunks_filepath.with_suffix(f'.{chunk_id}'), self._schema, chunks_filepath.with_suffix(f'.{chunk_id}'), schema))
+                        for chunk_id in range(self._num_of_chunks) if chunk_id not in lengths
+                    )
+                    for chunk_id, status, result in process_pool_imap(transform_chunk, tasks, worker_number=worker_number):
+                        if status != 'ok':
+                            logger.error(f'An Error occurred while transforming the chunk {chunk_id} of \'{self._cache_dirpath}\' into \'{cache_dirpath}\': {result}')
+                            raise RuntimeError(f'Failed To {kind.capitalize()} Chunk {chunk_id}.')
+                        save_pickle(result, stage_dirpath.joinpath(f'done.{chunk_id}'))
+                        lengths[chunk_id] = result
+
+                    config = dict(
+                        size_of_chunk = self._size_of_chunk,
+                        length_of_itr = sum(lengths.values()),
+                        num_of_chunks = self._num_of_chunks,
+                        chunk_lengths = [lengths[chunk_id] for chunk_id in range(self._num_of_chunks)],
+                        schema = schema,
+                    )
+                    for chunk_id in range(self._num_of_chunks):
+                        stage_dirpath.joinpath(f'done.{chunk_id}').unlink()
+                    for temp_filepath in stage_dirpath.glob('.*'):
+                        temp_filepath.unlink()
+                    stage_filepath.unlink()
+                    save_pickle(0, stage_dirpath.joinpath(self.__class__._status_cache_filename_))
+                    save_pickle(config, stage_dirpath.joinpath(self.__class__._config_cache_filename_))
+                    publish_dir(stage_dirpath, cache_dirpath, self.__class__._config_cache_filename_)
+
+        return self.__class__(cache_dirpath, iter(()), self._size_of_chunk, schema=schema)
+
+    def map(self, function: Callable[[Any], Any], cache_dirpath: pathlib.Path, worker_number: int | None = None, schema: dict[str, str] | None = None, version: str | None = None) -> 'CachedChunks':
+        r"""Returns the CachedChunks at 'cache_dirpath' of 'function' applied to every item, built on a pool of processes if it does not exist yet.
+
+        Every source chunk is transformed by a worker into the output chunk of the same ID, so the order of items is kept and the data never goes through the pool pipes.
+        The completion of every chunk is recorded, so an interrupted run resumes with the unfinished chunks only.
+        'function' must be picklable (defined at module level), and 'schema' is the schema of the output, if columnar (records of columnar sources are given as dicts).
+
+        An interrupted run is only resumed by the same stage: the same source, kind, 'function', 'version' and 'schema'; any other stage starts over.
+        'function' is identified by its name (and the arguments bound by :func:`functools.partial`), not by its code,
+        so pass a new 'version' whenever the code of 'function' changes. A published 'cache_dirpath' is always reused as is.
+
+        Args:
+            worker_number (int | None): The number of worker processes. Defaults to the configured number, or the number of CPUs.
+            version (str | None): The version of the code of 'function'.
+        """
+        return self._transform(function, 'map', cache_dirpath, worker_number, schema, version)
+
+    def filter(self, function: Callable[[Any], bool], cache_dirpath: pathlib.Path, worker_number: int | None = None, schema: dict[str, str] | None = None, version: str | None = None) -> 'CachedChunks':
+        r"""Returns the CachedChunks at 'cache_dirpath' of the items for which 'function' is True, built and resumed like :meth:`map`. Output chunks may be smaller than 'size_of_chunk'."""
+        return self._transform(function, 'filter', cache_dirpath, worker_number, schema, version)
+
+    def _save_status(self) -> None:
+        # Written into a temporary file first, so the status is never seen half-written, even if the process is killed.
+        temp_filepath = self._status_filepath.with_name(f'.{self.__class__._status_cache_filename_}.{os.getpid()}')
+        save_pickle(self._current_index, temp_filepath)
+        os.replace(temp_filepath, self._status_filepath)
+
+    def rewind(self, chunk_id: int = 0) -> None:
+        r"""Moves the iteration back (or forth) to the chunk 'chunk_id' and records it, so a later CachedChunks of the same cache also resumes from there."""
+        assert 0 <= chunk_id <= self._num_of_chunks, f'Chunk ID {chunk_id} Out Of Range [0, {self._num_of_chunks}].'
+        self._current_index = chunk_id
+        self._save_status()
+
+    def _load_chunk(self, chunk_id: int) -> list | dict[str, bytes]:
+        start_time = time.perf_counter()
+        chunk = load_pickle(self._chunks_filepath.with_suffix(f'.{chunk_id}'))
+        observe_histogram('younger_cache_chunk_load_seconds', time.perf_counter() - start_time, help='Latency of loading one chunk of CachedChunks.')
+        increase_counter('younger_cache_chunks_loaded_total', help='Chunks loaded by CachedChunks.')
+        return chunk
 
     def __iter__(self):
         while self._current_index < self._num_of_chunks:
-            chunk = load_pickle(self._chunks_filepath.with_suffix(f'.{self._current_index}'))
+            chunk = self._load_chunk(self._current_index)
+            if self._schema is not None:
+                columns = decode_columns(chunk, self._schema)
+                chunk = [dict(zip(columns.keys(), values)) for values in zip(*columns.values())]
             yield chunk
             self._current_index += 1
-            save_pickle(self._current_index, self._status_filepath)
+            self._save_status()
+
+    def iter_batches(self) -> Iterator[dict[str, memoryview | StringColumn]]:
+        r"""Iterates over the chunks of a columnar cache as batches of columns (column name -> memoryview, or :class:`StringColumn`), resuming like iterating over the chunks."""
+        assert self._schema is not None, f'Only Columnar CachedChunks (Built With A \'schema\') Can Be Iterated In Batches.'
+        while self._current_index < self._num_of_chunks:
+            yield decode_columns(self._load_chunk(self._current_index), self._schema)
+            self._current_index += 1
+            self._save_status()
 
     def __next__(self):
         return next(self)
@@ -98,8 +350,12 @@ class CachedChunks(object):
 
     @property
     def current_position(self):
-        return min(self._current_index * self._size_of_chunk, self._length_of_itr)
+        return self._chunk_positions[self._current_index]
 
     @property
     def current_chunk_id(self):
         return self._current_index
+
+    @property
+    def schema(self) -> dict[str, str] | None:
+        return self._schema
@@ -6,18 +6,195 @@
 # Author: Jason Young (杨郑鑫).
 # E-Mail: AI.Jason.Young@outlook.com
 # Last Modified by: Jason Young (杨郑鑫)
-# Last Modified time: 2024-12-17 10:31:36
+# Last Modified time: 2026-10-19 19:05:12
 # Copyright (c) 2024 Yangs.AI
-# 
+#
 # This source code is licensed under the Apache License 2.0 found in the
 # LICENSE file in the root directory of this source tree.
 ########################################################################
 
 
+import os
+import warnings
+
 from pathlib import Path
+from typing import Any, Mapping
+
+from younger.commons.constants import Constant, YoungerHandle
 
 
 """
-..TODO::
-    For Future - ~/.younger directory configuration
+Runtime configuration of Younger, read once per process from (in increasing priority):
+    1. The defaults of CONFIG_SCHEMA;
+    2. The TOML file '~/.younger/config.toml', or the file given by the environment variable 'YOUNGER_CONFIG';
+    3. The environment variables 'YOUNGER_<SECTION>_<NAME>', e.g. 'YOUNGER_IO_HASH_BLOCK_SIZE=4194304'.
+
+A malformed file, an unknown setting or an invalid value is ignored with a warning, so a typo never makes Younger unusable.
+
+The TOML file has one table per section, e.g.:
+    [io]
+    hash_block_size = 4194304
+    [pool]
+    worker_number = 16
 """
+
+
+CONFIG_FILEPATH_ENVIRON = 'YOUNGER_CONFIG'
+
+CONFIG_ENVIRON_PREFIX = 'YOUNGER_'
+
+DEFAULT_CONFIG_FILEPATH = Path.home().joinpath('.younger', 'config.toml')
+
+# Section -> Name -> (Type, Default). A default of None means 'unset'.
+CONFIG_SCHEMA: dict[str, dict[str, tuple[type, Any]]] = dict(
+    io = dict(
+        hash_block_size = (int, 1024 * 1024),
+        download_block_size = (int, 64 * 1024),
+    ),
+    pool = dict(
+        worker_number = (int, 0), # 0 - The number of CPUs.
+    ),
+    cache = dict(
+        root = (Path, Path.home().joinpath(f'.cache/{YoungerHandle.MainName}')),
+        artifacts_max_bytes = (int, 0), # 0 - Unlimited.
+    ),
+    compression = dict(
+        compress = (bool, True),
+        level = (int, 9),
+    ),
+    logging = dict(
+        mode = (str, 'console'),
+        level = (str, 'INFO'),
+        filepath = (Path, None),
+        asynchronous = (bool, False),
+        style = (str, 'text'),
+    ),
+    metrics = dict(
+        enabled = (bool, False),
+    ),
+)
+
+
+# Section -> Name -> Choices, for the settings restricted to a few values.
+CONFIG_CHOICES: dict[str, dict[str, set]] = dict(
+    logging = dict(
+        mode = {'both', 'file', 'console'},
+        level = {'INFO', 'WARN', 'ERROR', 'DEBUG', 'FATAL', 'NOTSET'},
+        style = {'text', 'json'},
+    ),
+)
+
+# Section -> Name -> (Minimum, Maximum), for the integer settings restricted to a range. A bound of None means 'unbounded'.
+CONFIG_BOUNDS: dict[str, dict[str, tuple[int | None, int | None]]] = dict(
+    io = dict(
+        hash_block_size = (1, None),
+        download_block_size = (1, None),
+    ),
+    pool = dict(
+        worker_number = (0, None),
+    ),
+    cache = dict(
+        artifacts_max_bytes = (0, None),
+    ),
+    compression = dict(
+        level = (0, 9),
+    ),
+)
+
+
+def convert_config_value(section: str, name: str, value: Any) -> Any:
+    value_type, _ = CONFIG_SCHEMA[section][name]
+    if isinstance(value, str):
+        if value_type is bool:
+            assert value.lower() in {'1', '0', 'true', 'false', 'yes', 'no', 'on', 'off'}, f'Invalid Boolean Config Value - \'{section}.{name}\': \'{value}\'.'
+            value = value.lower() in {'1', 'true', 'yes', 'on'}
+        elif value_type is int:
+            value = int(value)
+        elif value_type is Path:
+            value = None if value == '' else Path(value).expanduser()
+    else:
+        assert isinstance(value, value_type) and not (value_type is int and isinstance(value, bool)), f'Config Value \'{section}.{name}\' Must Be \'{value_type.__name__}\', Got \'{type(value).__name__}\'.'
+
+    choices = CONFIG_CHOICES.get(section, dict()).get(name, None)
+    assert choices is None or value in choices, f'Config Value \'{section}.{name}\' Must Be One Of {sorted(choices)}, Got \'{value}\'.'
+
+    minimum, maximum = CONFIG_BOUNDS.get(section, dict()).get(name, (None, None))
+    assert (minimum is None or minimum <= value) and (maximum is None or value <= maximum), f'Config Value \'{section}.{name}\' Must Be In [{minimum}, {maximum}], Got \'{value}\'.'
+    return value
+
+
+def update_config_value(values: dict[str, dict[str, Any]], section: str, name: str, value: Any, source: str) -> None:
+    # An invalid value is ignored, the setting keeps the value of the sources of lower priority.
+    try:
+        values[section][name] = convert_config_value(section, name, value)
+    except (AssertionError, ValueError) as exception:
+        warnings.warn(f'Invalid Config \'{section}.{name}\' In {source}, Ignored: {exception}')
+
+
+def load_config(filepath: Path | str | None = None, environ: Mapping[str, str] | None = None) -> Constant:
+    r"""Reads the configuration from 'filepath' and 'environ' over the defaults of CONFIG_SCHEMA, without caching it (see :func:`get_config`).
+
+    Args:
+        filepath (Path | str | None): The TOML file. Defaults to the file given by 'YOUNGER_CONFIG', or '~/.younger/config.toml'. A missing file is skipped.
+        environ (Mapping[str, str] | None): The environment variables. Defaults to os.environ.
+
+    Returns:
+        Constant: A frozen Constant of sections, each a frozen Constant of settings, e.g. config.io.hash_block_size.
+    """
+    environ = os.environ if environ is None else environ
+    filepath = Path(filepath or environ.get(CONFIG_FILEPATH_ENVIRON, '') or DEFAULT_CONFIG_FILEPATH).expanduser()
+
+    values = {section: {name: default for name, (_, default) in settings.items()} for section, settings in CONFIG_SCHEMA.items()}
+
+    file_values = dict()
+    if filepath.is_file():
+        import tomllib
+        try:
+            with open(filepath, 'rb') as file:
+                file_values = tomllib.load(file)
+        except tomllib.TOMLDecodeError as exception:
+            warnings.warn(f'Malformed Config File \'{filepath}\', Ignored: {exception}')
+
+    for section, settings in file_values.items():
+        if section not in CONFIG_SCHEMA or not isinstance(settings, dict):
+            warnings.warn(f'Unknown Config Section \'{section}\' In \'{filepath}\'.')
+            continue
+        for name, value in settings.items():
+            if name not in CONFIG_SCHEMA[section]:
+                warnings.warn(f'Unknown Config \'{section}.{name}\' In \'{filepath}\'.')
+                continue
+            update_config_value(values, section, name, value, f'\'{filepath}\'')
+
+    for section, settings in CONFIG_SCHEMA.items():
+        for name in settings:
+            environ_name = f'{CONFIG_ENVIRON_PREFIX}{section.upper()}_{name.upper()}'
+            value = environ.get(environ_name, None)
+            if value is not None:
+                update_config_value(values, section, name, value, f'\'{environ_name}\'')
+
+    config = Constant()
+    for section, settings in values.items():
+        section_config = Constant(**settings)
+        section_config.freeze()
+        setattr(config, section, section_config)
+    config.freeze()
+    return config
+
+
+CONFIG: Constant | None = None
+
+
+def set_config(config: Constant | None) -> None:
+    r"""Replaces the configuration of this process, None makes the next :func:`get_config` read it again."""
+    assert config is None or isinstance(config, Constant)
+    global CONFIG
+    CONFIG = config
+    return
+
+
+def get_config() -> Constant:
+    r"""Returns the configuration of this process, read on the first call (see :func:`load_config`)."""
+    global CONFIG
+    if CONFIG is None:
+        CONFIG = load_config()
+    return CONFIG
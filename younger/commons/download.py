@@ -14,27 +14,74 @@
 ########################################################################
 
 
-import tqdm
-import fsspec
+import os
+import re
+import time
+import shutil
+import hashlib
 import pathlib
-import requests
+import tarfile
+import tempfile
 
-from younger.commons.io import create_dir
+from typing import Iterator
 
+from younger.commons.io import create_dir, load_json, save_json
+from younger.commons.store import ArtifactStore
+from younger.commons.metrics import THROUGHPUT_BUCKETS, increase_counter, observe_histogram
+from younger.commons.configure import get_config
 
-def download(url: str, dirpath: pathlib.Path, filename: str | None = None, force: bool = True, proxy: str | None = None):
-    r"""Downloads the content of an URL to a specific directory path.
 
-    Args:
-        url (str): The URL.
-        dirpath (pathlib.Path): The folder.
+DOWNLOAD_METADATA_SUFFIX = '.meta'
+
+
+def get_download_metadata_filepath(filepath: pathlib.Path) -> pathlib.Path:
+    return filepath.with_name(f'{filepath.name}{DOWNLOAD_METADATA_SUFFIX}')
+
+
+def load_download_metadata(filepath: pathlib.Path, url: str) -> dict | None:
+    r"""Loads the sidecar metadata recorded for a downloaded file.
+
+    Returns ``None`` if the file or its metadata does not exist, or if the metadata was recorded for another URL.
     """
-    if filename is None:
-        filename = url.rpartition('/')[2]
-        filename = filename if filename[0] == '?' else filename.split('?')[0]
+    metadata_filepath = get_download_metadata_filepath(filepath)
+    if not (filepath.is_file() and metadata_filepath.is_file()):
+        return None
 
-    filepath = dirpath.joinpath(filename)
+    try:
+        metadata = load_json(metadata_filepath)
+    except Exception:
+        return None
+
+    if not isinstance(metadata, dict) or metadata.get('url') != url:
+        return None
+    return metadata
+
+
+def save_download_metadata(filepath: pathlib.Path, url: str, headers: dict, content_length: int, complete: bool) -> dict:
+    metadata = dict(
+        url = url,
+        etag = headers.get('ETag', None),
+        last_modified = headers.get('Last-Modified', None),
+        content_length = content_length,
+        complete = complete,
+    )
+    save_json(metadata, get_download_metadata_filepath(filepath))
+    return metadata
+
+
+def delete_download_metadata(filepath: pathlib.Path) -> None:
+    get_download_metadata_filepath(filepath).unlink(missing_ok=True)
 
+
+def get_total_size_from_headers(headers: dict, default: int = 0) -> int:
+    # 'Content-Range: bytes 100-199/200' or 'Content-Range: bytes */200'
+    content_range = re.fullmatch(r'bytes\s+(?:\d+-\d+|\*)/(\d+)', headers.get('Content-Range', '').strip())
+    if content_range is not None:
+        return int(content_range.group(1))
+    return default
+
+
+def get_proxies(proxy: str | None) -> dict[str, str] | None:
     if proxy:
         print(f'URL Requests Through Proxy {proxy}')
         proxies = dict(
@@ -43,31 +90,331 @@ def download(url: str, dirpath: pathlib.Path, filename: str | None = None, force
         )
     else:
         proxies = None
+    return proxies
+
+
+def record_download_metrics(transferred_bytes: int, transfer_time: float) -> None:
+    increase_counter('younger_download_bytes_total', transferred_bytes, help='Bytes transferred by downloads.')
+    observe_histogram('younger_download_seconds', transfer_time, help='Duration of the body transfers of downloads.')
+    if 0 < transferred_bytes and 0 < transfer_time:
+        observe_histogram('younger_download_throughput_bytes_per_second', transferred_bytes / transfer_time, help='Throughput of the body transfers of downloads.', buckets=THROUGHPUT_BUCKETS)
+
+
+def detach_file(filepath: pathlib.Path) -> None:
+    r"""Replaces a hardlinked file (e.g. materialized from an artifact store, see :class:`ArtifactStore`) by a private copy, so it can be written in place."""
+    if 1 < filepath.stat().st_nlink:
+        temp_filepath = filepath.with_name(f'.{filepath.name}.detach')
+        shutil.copyfile(filepath, temp_filepath)
+        os.replace(temp_filepath, filepath)
+
+
+def download(url: str, dirpath: pathlib.Path, filename: str | None = None, force: bool = True, proxy: str | None = None, store: ArtifactStore | None = None):
+    r"""Downloads the content of an URL to a specific directory path.
+
+    The validators (ETag, Last-Modified, Content-Length) returned by the server are recorded in a sidecar metadata file next to the downloaded file.
+    A complete file is revalidated with a conditional request (If-None-Match/If-Modified-Since), so an unchanged file costs one round-trip and no body transfer.
+    A partial file is resumed with a Range request guarded by If-Range, so a partial file of a changed remote is downloaded again from scratch.
+
+    If 'store' is given, a file already fetched from 'url' anywhere on the machine is materialized from the store instead of being transferred again,
+    and every newly transferred file is added to the store.
+
+    Args:
+        url (str): The URL.
+        dirpath (pathlib.Path): The folder.
+        filename (str | None): The filename. Defaults to the last component of the URL.
+        force (bool): If False, a file recorded as complete is returned without contacting the server. Defaults to True.
+        proxy (str | None): The proxy (host:port).
+        store (ArtifactStore | None): The content-addressed store shared across downloads. Defaults to None.
+    """
+    import tqdm
+    import fsspec
+    import requests
+
+    if filename is None:
+        filename = url.rpartition('/')[2]
+        filename = filename if filename[0] == '?' else filename.split('?')[0]
+
+    filepath = dirpath.joinpath(filename)
+
+    proxies = get_proxies(proxy)
 
     print(f'Downloading {url}')
 
     create_dir(dirpath)
 
-    block_size = 1024
+    if store is not None and not filepath.is_file():
+        record = store.lookup(url)
+        if record is not None:
+            store.materialize(record['digest'], filepath)
+            save_download_metadata(filepath, url, {'ETag': record['etag'], 'Last-Modified': record['last_modified']}, record['size'], True)
+            print(f'File is materialized from the artifact store: {filename}')
+
+    block_size = get_config().io.download_block_size
     if filepath.is_file():
         resume_byte_pos = filepath.stat().st_size
     else:
         resume_byte_pos = 0
 
-    response = requests.get(url, stream=True, allow_redirects=True, proxies=proxies)
-    total_size = int(response.headers.get('Content-Length', '0'))
+    metadata = load_download_metadata(filepath, url)
+    validator = None if metadata is None else (metadata['etag'] or metadata['last_modified'])
+
+    headers = dict()
+    if metadata is not None and metadata['complete'] and metadata['content_length'] in {0, resume_byte_pos}:
+        if not force:
+            print(f'File is already downloaded: {filename}')
+            return filepath
+        if metadata['etag']:
+            headers['If-None-Match'] = metadata['etag']
+        if metadata['last_modified']:
+            headers['If-Modified-Since'] = metadata['last_modified']
+        if len(headers) == 0:
+            headers['Range'] = f'bytes={resume_byte_pos}-'
+    elif 0 < resume_byte_pos:
+        headers['Range'] = f'bytes={resume_byte_pos}-'
+        if validator:
+            headers['If-Range'] = validator
+
+    with requests.get(url, stream=True, headers=headers, allow_redirects=True, proxies=proxies) as response:
+        if response.status_code == 304:
+            print(f'File is already downloaded: {filename}')
+            return filepath
+
+        if response.status_code == 416:
+            total_size = get_total_size_from_headers(response.headers, default=resume_byte_pos)
+            if total_size == resume_byte_pos:
+                validators = response.headers if metadata is None else {'ETag': metadata['etag'], 'Last-Modified': metadata['last_modified']}
+                save_download_metadata(filepath, url, validators, total_size, True)
+                print(f'File is already downloaded: {filename}')
+                return filepath
+            # The local file is longer than the remote one, it must be stale.
+            filepath.unlink()
+            delete_download_metadata(filepath)
+            return download(url, dirpath, filename=filename, force=force, proxy=proxy, store=store)
 
-    headers = {'Content-Length': '0', 'Range': f'bytes={resume_byte_pos}-'}
-    response = requests.get(url, stream=True, headers=headers, allow_redirects=True, proxies=proxies)
-    if not force and (resume_byte_pos == total_size or total_size == 0):
-        print(f'File is already downloaded: {filename}')
-        return filepath
+        response.raise_for_status()
 
-    if resume_byte_pos < total_size:
-        with tqdm.tqdm(total=total_size, initial=resume_byte_pos, unit="iB", unit_scale=True, unit_divisor=1024, desc=filename) as progress_bar:
-            with fsspec.open(filepath, "ab") as f:
+        if response.status_code == 206:
+            mode = 'ab'
+            initial = resume_byte_pos
+            # The file may be a (read-only) link into the artifact store, never append through it.
+            detach_file(filepath)
+            total_size = get_total_size_from_headers(response.headers, default=resume_byte_pos + int(response.headers.get('Content-Length', '0')))
+        else:
+            mode = 'wb'
+            initial = 0
+            total_size = int(response.headers.get('Content-Length', '0'))
+            # The file may be a (read-only) link into the artifact store, never write through it.
+            filepath.unlink(missing_ok=True)
+
+        save_download_metadata(filepath, url, response.headers, total_size, False)
+        start_time = time.perf_counter()
+        transferred_bytes = 0
+        with tqdm.tqdm(total=total_size or None, initial=initial, unit="iB", unit_scale=True, unit_divisor=1024, desc=filename) as progress_bar:
+            with fsspec.open(filepath, mode) as f:
                 for data in response.iter_content(block_size):
                     f.write(data)
                     progress_bar.update(len(data))
+                    transferred_bytes += len(data)
+        record_download_metrics(transferred_bytes, time.perf_counter() - start_time)
+
+        metadata = save_download_metadata(filepath, url, response.headers, total_size, total_size == 0 or filepath.stat().st_size == total_size)
+
+    if store is not None and metadata['complete']:
+        store.ingest(filepath, url=url, etag=metadata['etag'], last_modified=metadata['last_modified'])
+        if 0 < get_config().cache.artifacts_max_bytes:
+            store.evict(get_config().cache.artifacts_max_bytes)
 
     return filepath
+
+
+class HashingStream(object):
+    r"""A read-only file-like object over an iterator of byte blocks.
+
+    Each block is fed to the hasher (and written to the sink, if any) as soon as it is pulled from the iterator,
+    so the consumer, the checksum and the kept copy all share one pass over the bytes.
+    """
+    def __init__(self, blocks: Iterator[bytes], hasher: 'hashlib._Hash', sink=None, progress_bar: 'tqdm.tqdm | None' = None):
+        self._blocks = blocks
+        self._hasher = hasher
+        self._sink = sink
+        self._progress_bar = progress_bar
+        self._buffer = bytearray()
+        self._exhausted = False
+        self._size = 0
+
+    def _pull(self) -> bool:
+        for block in self._blocks:
+            if len(block) == 0:
+                continue
+            self._hasher.update(block)
+            self._size += len(block)
+            if self._sink is not None:
+                self._sink.write(block)
+            if self._progress_bar is not None:
+                self._progress_bar.update(len(block))
+            self._buffer.extend(block)
+            return True
+        self._exhausted = True
+        return False
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._exhausted and (size < 0 or len(self._buffer) < size):
+            self._pull()
+        if size < 0 or len(self._buffer) <= size:
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        return data
+
+    def drain(self) -> None:
+        while self._pull():
+            self._buffer.clear()
+        self._buffer.clear()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def hexdigest(self) -> str:
+        return str(self._hasher.hexdigest())
+
+
+def merge_dir(src_dirpath: pathlib.Path, dst_dirpath: pathlib.Path) -> None:
+    # Moves (renames) the contents of 'src_dirpath' into 'dst_dirpath', file by file, without copying any data.
+    create_dir(dst_dirpath)
+    for src_path in src_dirpath.iterdir():
+        dst_path = dst_dirpath.joinpath(src_path.name)
+        if src_path.is_dir() and not src_path.is_symlink() and dst_path.is_dir():
+            merge_dir(src_path, dst_path)
+        else:
+            if dst_path.is_dir() and not dst_path.is_symlink():
+                shutil.rmtree(dst_path)
+            os.replace(src_path, dst_path)
+    os.rmdir(src_dirpath)
+
+
+def check_tar_members(tar: tarfile.TarFile) -> Iterator[tarfile.TarInfo]:
+    r"""Yields the members of 'tar' as they are read, raising a ValueError on any member that could be written outside the extraction directory.
+
+    Absolute names, names with '..' components, links to absolute or '..' targets and special files (devices, FIFOs) are rejected.
+    """
+    for member in tar:
+        names = [member.name] + ([member.linkname] if member.issym() or member.islnk() else [])
+        for name in names:
+            path = pathlib.PurePosixPath(name)
+            if path.is_absolute() or pathlib.PureWindowsPath(name).drive or '..' in path.parts:
+                raise ValueError(f'Unsafe Member In Tar Archive: \'{member.name}\'.')
+        if not (member.isfile() or member.isdir() or member.issym() or member.islnk()):
+            raise ValueError(f'Unsupported Member Type In Tar Archive: \'{member.name}\'.')
+        yield member
+
+
+def stream_download(
+    url: str,
+    dirpath: pathlib.Path | None = None,
+    extract_dirpath: pathlib.Path | None = None,
+    filename: str | None = None,
+    compress: bool = True,
+    hash_algorithm: str = 'SHA256',
+    digest_size: int | None = None,
+    checksum: str | None = None,
+    proxy: str | None = None
+) -> str:
+    r"""Downloads, hashes and (optionally) extracts a tar archive in a single pass over the network stream.
+
+    The archive is kept in 'dirpath' only if 'dirpath' is given, so a release can be ingested without ever being stored;
+    it is written aside and replaces a former file only after the checksum has been verified.
+    If 'extract_dirpath' is given, the members are extracted on the fly into a temporary directory next to it,
+    and are moved into 'extract_dirpath' only after the checksum has been verified.
+    Members that could escape the temporary directory (see :func:`check_tar_members`) abort the download before anything is written.
+
+    Args:
+        url (str): The URL.
+        dirpath (pathlib.Path | None): The folder to keep the archive in. Defaults to None (the archive is not kept).
+        extract_dirpath (pathlib.Path | None): The folder to extract the archive into. Defaults to None (no extraction).
+        filename (str | None): The filename of the kept archive. Defaults to the last component of the URL.
+        compress (bool): Whether the archive is gzip compressed. Defaults to True.
+        hash_algorithm (str): The hash algorithm. Defaults to 'SHA256'.
+        digest_size (int | None): The digest size, only for variable-length hash algorithms.
+        checksum (str | None): The expected hex digest. Defaults to None (not verified).
+        proxy (str | None): The proxy (host:port).
+
+    Returns:
+        str: The hex digest of the downloaded bytes.
+
+    Raises:
+        ValueError: If the checksum does not match, or if the archive holds an unsafe member. Nothing is kept, replaced or extracted then.
+    """
+    import tqdm
+    import requests
+
+    assert dirpath is not None or extract_dirpath is not None, f'At Least One of \'dirpath\' and \'extract_dirpath\' Must Be Specified.'
+
+    if filename is None:
+        filename = url.rpartition('/')[2]
+        filename = filename if filename[0] == '?' else filename.split('?')[0]
+
+    proxies = get_proxies(proxy)
+
+    print(f'Stream Downloading {url}')
+
+    block_size = get_config().io.download_block_size
+    hasher = hashlib.new(hash_algorithm) if digest_size is None else hashlib.new(hash_algorithm, digest_size=digest_size)
+
+    if dirpath is not None:
+        create_dir(dirpath)
+        filepath = dirpath.joinpath(filename)
+        # The archive is written aside and replaces 'filepath' once verified, so a former file (possibly a link into an artifact store) is never written through.
+        temp_filepath = dirpath.joinpath(f'.{filename}.part')
+        temp_filepath.unlink(missing_ok=True)
+        sink = open(temp_filepath, 'wb')
+    else:
+        filepath = None
+        temp_filepath = None
+        sink = None
+
+    if extract_dirpath is not None:
+        create_dir(extract_dirpath.parent)
+        temp_dirpath = pathlib.Path(tempfile.mkdtemp(prefix=f'.{extract_dirpath.name}.', dir=extract_dirpath.parent))
+    else:
+        temp_dirpath = None
+
+    try:
+        with requests.get(url, stream=True, allow_redirects=True, proxies=proxies) as response:
+            response.raise_for_status()
+            total_size = int(response.headers.get('Content-Length', '0'))
+            start_time = time.perf_counter()
+            with tqdm.tqdm(total=total_size or None, unit="iB", unit_scale=True, unit_divisor=1024, desc=filename) as progress_bar:
+                stream = HashingStream(response.iter_content(block_size), hasher, sink=sink, progress_bar=progress_bar)
+                if temp_dirpath is not None:
+                    with tarfile.open(fileobj=stream, mode='r|gz' if compress else 'r|') as tar:
+                        # The 'data' filter (Python >= 3.11.4) additionally strips unsafe permissions.
+                        extract_kwargs = dict(filter='data') if hasattr(tarfile, 'data_filter') else dict()
+                        tar.extractall(temp_dirpath, members=check_tar_members(tar), **extract_kwargs)
+                stream.drain()
+            record_download_metrics(stream.size, time.perf_counter() - start_time)
+
+        digest = stream.hexdigest()
+        if checksum is not None and checksum != digest:
+            raise ValueError(f'Checksum Mismatch: Expect \'{checksum}\', Got \'{digest}\'.')
+
+        if sink is not None:
+            sink.close()
+            delete_download_metadata(filepath)
+            os.replace(temp_filepath, filepath)
+            save_download_metadata(filepath, url, response.headers, filepath.stat().st_size, True)
+
+        if temp_dirpath is not None:
+            merge_dir(temp_dirpath, extract_dirpath)
+
+    except Exception as exception:
+        if sink is not None:
+            sink.close()
+            temp_filepath.unlink(missing_ok=True)
+        if temp_dirpath is not None and temp_dirpath.is_dir():
+            shutil.rmtree(temp_dirpath)
+        raise exception
+
+    return digest
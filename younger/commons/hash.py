@@ -14,20 +14,29 @@
 ########################################################################
 
 
+import time
 import pathlib
 import hashlib
 
+from younger.commons.metrics import increase_counter, observe_histogram
+from younger.commons.configure import get_config
 
-def hash_file(filepath: pathlib.Path | str, block_size: int = 8192, hash_algorithm: str = "SHA256", digest_size: int | None = None) -> str:
+
+def hash_file(filepath: pathlib.Path | str, block_size: int | None = None, hash_algorithm: str = "SHA256", digest_size: int | None = None) -> str:
     filepath = pathlib.Path(filepath) if isinstance(filepath, str) else filepath
+    block_size = block_size or get_config().io.hash_block_size
     hasher = hashlib.new(hash_algorithm) if digest_size is None else hashlib.new(hash_algorithm, digest_size=digest_size)
+    start_time = time.perf_counter()
     with open(filepath, 'rb') as file:
         while True:
             block = file.read(block_size)
             if len(block) == 0:
                 break
             hasher.update(block)
+        hashed_bytes = file.tell()
 
+    increase_counter('younger_hash_file_bytes_total', hashed_bytes, help='Bytes hashed by hash_file.')
+    observe_histogram('younger_hash_file_seconds', time.perf_counter() - start_time, help='Latency of hash_file.')
     return str(hasher.hexdigest())
 
 
@@ -15,19 +15,28 @@
 
 
 import os
+import re
 import math
 import json
+import time
 import pickle
-import psutil
 import shutil
 import tarfile
 import pathlib
-import tomlkit
+import contextlib
 
-from typing import Any
+from typing import Any, Iterator, TextIO
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
 
 from younger.commons.hash import hash_bytes
 from younger.commons.logging import logger
+from younger.commons.metrics import increase_counter, observe_histogram
+from younger.commons.configure import get_config
 
 
 def get_system_depend_path(path: pathlib.Path | str) -> pathlib.Path:
@@ -75,16 +84,48 @@ def delete_dir(dirpath: pathlib.Path | str, only_clean: bool = False):
         os.rmdir(dirpath)
 
 
-def tar_archive(ri: pathlib.Path | str | list[pathlib.Path | str], archive_filepath: pathlib.Path, compress: bool = True):
+@contextlib.contextmanager
+def lock_file(lock_filepath: pathlib.Path | str, shared: bool = False) -> Iterator[None]:
+    r"""Holds an advisory inter-process lock on 'lock_filepath' (created if missing) for the duration of the context.
+
+    Shared locks are only honored on POSIX, on Windows every lock is exclusive.
+    """
+    lock_filepath = get_system_depend_path(lock_filepath)
+    create_dir(lock_filepath.parent)
+    with open(lock_filepath, 'a+b') as lock:
+        if fcntl is not None:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        else:
+            lock.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.05)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+            else:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def tar_archive(ri: pathlib.Path | str | list[pathlib.Path | str], archive_filepath: pathlib.Path, compress: bool | None = None):
     ri = get_system_depend_paths(ri) if isinstance(ri, list) else get_system_depend_path(ri)
     archive_filepath = get_system_depend_path(archive_filepath)
     # ri - read in
+    compress = get_config().compression.compress if compress is None else compress
     if compress:
         mode = 'w:gz'
+        options = dict(compresslevel=get_config().compression.level)
     else:
         mode = 'w'
+        options = dict()
 
-    with tarfile.open(archive_filepath, mode=mode, dereference=False) as tar:
+    with tarfile.open(archive_filepath, mode=mode, dereference=False, **options) as tar:
         if isinstance(ri, list):
             for path in ri:
                 tar.add(path, arcname=os.path.basename(path))
@@ -92,11 +133,14 @@ def tar_archive(ri: pathlib.Path | str | list[pathlib.Path | str], archive_filep
             tar.add(ri, arcname=os.path.basename(ri))
 
 
-def tar_extract(archive_filepath: pathlib.Path | str, wo: pathlib.Path | str, compress: bool = True):
+def tar_extract(archive_filepath: pathlib.Path | str, wo: pathlib.Path | str, compress: bool | None = None):
     archive_filepath = get_system_depend_path(archive_filepath)
     wo = get_system_depend_path(wo)
     # wo - write out
-    if compress:
+    # compress - None: Detect the compression from the archive.
+    if compress is None:
+        mode = 'r:*'
+    elif compress:
         mode = 'r:gz'
     else:
         mode = 'r'
@@ -117,6 +161,114 @@ def load_json(filepath: pathlib.Path | str, cls: json.JSONDecoder | None = None)
     return serializable_object
 
 
+JSON_WHITESPACE_Regex = re.compile(r'[ \t\n\r]*')
+
+JSON_NUMBER_TAIL_Regex = re.compile(r'[0-9.eE+\-]*')
+
+# The longest tokens an error can be reported at the start of, if they are cut by the end of the buffer: '-Infinity', or a surrogate pair '\ud83d\ude00'.
+JSON_INCOMPLETE_TOKEN_LENGTH = 12
+
+
+def iterate_json_from_stream(stream: TextIO, decoder: json.JSONDecoder | None = None, block_size: int = 1024 * 1024) -> Iterator[object | tuple[str, object]]:
+    r"""Iterates over a top-level JSON array (yielding its elements) or object (yielding its (key, value) pairs) read from a text stream, one element at a time.
+
+    Each element is decoded by 'decoder.raw_decode' as soon as it is complete in the buffer, and the consumed prefix of the buffer is dropped,
+    so the memory used is bounded by the size of one element plus 'block_size' characters, whatever the size of the document.
+    """
+    decoder = json.JSONDecoder() if decoder is None else decoder
+    buffer = ''
+    position = 0
+    exhausted = False
+
+    def read() -> bool:
+        nonlocal buffer, position, exhausted
+        if exhausted:
+            return False
+        if len(buffer) <= 2 * position:
+            buffer = buffer[position:]
+            position = 0
+        # Reads at least as much as the unconsumed data, so a large element is decoded in an amortized linear time.
+        data = stream.read(max(block_size, len(buffer) - position))
+        if len(data) == 0:
+            exhausted = True
+            return False
+        buffer = buffer + data
+        return True
+
+    def skip_whitespace() -> str:
+        nonlocal position
+        while True:
+            position = JSON_WHITESPACE_Regex.match(buffer, position).end()
+            if position < len(buffer):
+                return buffer[position]
+            if not read():
+                return ''
+
+    def decode() -> object:
+        nonlocal position
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as exception:
+                # Only an error at the end of the buffer may be due to a cut element, any other one is raised at once, without reading the rest of the stream.
+                # A string is reported as unterminated at its start, but a string of a valid document always ends at a later quote.
+                incomplete = len(buffer) - exception.pos <= JSON_INCOMPLETE_TOKEN_LENGTH or exception.msg == 'Unterminated string starting at'
+                if incomplete and read():
+                    continue
+                raise exception
+            # A number followed by nothing but number characters up to the end of the buffer may be cut (e.g. '12' of '123', or '2.5' of '2.5e3').
+            if JSON_NUMBER_TAIL_Regex.match(buffer, end).end() == len(buffer) and read():
+                continue
+            position = end
+            return value
+
+    opening = skip_whitespace()
+    if opening not in {'[', '{'}:
+        raise json.JSONDecodeError('Expecting a top-level array or object', buffer, position)
+    closing = ']' if opening == '[' else '}'
+    position += 1
+
+    character = skip_whitespace()
+    if character == closing:
+        position += 1
+    else:
+        while True:
+            if opening == '{':
+                if character != '"':
+                    raise json.JSONDecodeError('Expecting property name enclosed in double quotes', buffer, position)
+                key = decode()
+                if skip_whitespace() != ':':
+                    raise json.JSONDecodeError('Expecting \':\' delimiter', buffer, position)
+                position += 1
+                skip_whitespace()
+                yield key, decode()
+            else:
+                yield decode()
+
+            character = skip_whitespace()
+            if character == closing:
+                position += 1
+                break
+            if character != ',':
+                raise json.JSONDecodeError('Expecting \',\' delimiter', buffer, position)
+            position += 1
+            character = skip_whitespace()
+
+    if skip_whitespace() != '':
+        raise json.JSONDecodeError('Extra data', buffer, position)
+
+
+def iterate_json(filepath: pathlib.Path | str, cls: json.JSONDecoder | None = None, block_size: int = 1024 * 1024) -> Iterator[object | tuple[str, object]]:
+    r"""Iterates over the elements of the top-level array, or the (key, value) pairs of the top-level object, of a JSON file without loading the whole file (see :func:`iterate_json_from_stream`)."""
+    filepath = get_system_depend_path(filepath)
+    try:
+        with open(filepath, 'r', encoding='utf-8') as file:
+            yield from iterate_json_from_stream(file, decoder=json.JSONDecoder() if cls is None else cls(), block_size=block_size)
+    except Exception as exception:
+        logger.error(f'An Error occurred while iterating serializable objects from the \'json\' file: {str(exception)}')
+        raise exception
+
+
 def save_json(serializable_object: object, filepath: pathlib.Path | str, cls: json.JSONEncoder | None = None, indent: int | str | None = None) -> None:
     filepath = get_system_depend_path(filepath)
     try:
@@ -133,21 +285,29 @@ def save_json(serializable_object: object, filepath: pathlib.Path | str, cls: js
 def load_pickle(filepath: pathlib.Path | str) -> object:
     filepath = get_system_depend_path(filepath)
     try:
+        start_time = time.perf_counter()
         with open(filepath, 'rb') as file:
             safety_data = pickle.load(file)
+            read_bytes = file.tell()
 
+        checksum_start_time = time.perf_counter()
         assert hash_bytes(safety_data['main']) == safety_data['checksum']
+        checksum_time = time.perf_counter() - checksum_start_time
         serializable_object = pickle.loads(safety_data['main'])
     except Exception as exception:
         logger.error(f'An Error occurred while reading serializable object from the \'pickle\' file: {str(exception)}')
         raise exception
 
+    increase_counter('younger_io_pickle_read_bytes_total', read_bytes, help='Bytes read by load_pickle.')
+    observe_histogram('younger_io_pickle_load_seconds', time.perf_counter() - start_time, help='Latency of load_pickle, checksum verification included.')
+    observe_histogram('younger_io_pickle_checksum_seconds', checksum_time, help='Latency of the checksum verification of load_pickle.')
     return serializable_object
 
 
 def save_pickle(serializable_object: object, filepath: pathlib.Path | str) -> None:
     filepath = get_system_depend_path(filepath)
     try:
+        start_time = time.perf_counter()
         create_dir(filepath.parent)
         serialized_object = pickle.dumps(serializable_object)
         safety_data = dict(
@@ -156,10 +316,13 @@ def save_pickle(serializable_object: object, filepath: pathlib.Path | str) -> No
         )
         with open(filepath, 'wb') as file:
             pickle.dump(safety_data, file)
+            written_bytes = file.tell()
     except Exception as exception:
         logger.error(f'An Error occurred while writing serializable object into the \'pickle\' file: {str(exception)}')
         raise exception
 
+    increase_counter('younger_io_pickle_written_bytes_total', written_bytes, help='Bytes written by save_pickle.')
+    observe_histogram('younger_io_pickle_save_seconds', time.perf_counter() - start_time, help='Latency of save_pickle.')
     return
 
 
@@ -185,6 +348,7 @@ def saves_pickle(serializable_object: object) -> str:
 
 def load_toml(filepath: pathlib.Path | str) -> dict:
     filepath = get_system_depend_path(filepath)
+    import tomlkit
     try:
         with open(filepath, 'rb') as file:
             config = tomlkit.load(file)
@@ -197,6 +361,7 @@ def load_toml(filepath: pathlib.Path | str) -> dict:
 
 def save_toml(config: dict, filepath: pathlib.Path | str) -> None:
     filepath = get_system_depend_path(filepath)
+    import tomlkit
     try:
         create_dir(filepath.parent)
         with open(filepath, 'w') as file:
@@ -209,6 +374,7 @@ def save_toml(config: dict, filepath: pathlib.Path | str) -> None:
 
 
 def get_disk_free_size(path: pathlib.Path | str) -> int:
+    import psutil
     path = get_system_depend_path(path)
     disk_usage = psutil.disk_usage(path)
     return disk_usage.free
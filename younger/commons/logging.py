@@ -16,13 +16,21 @@
 
 import os
 import sys
+import copy
+import json
+import time
+import queue
+import atexit
+import threading
 import pathlib
 import logging
+import logging.handlers
 
-from typing import Literal
+from typing import Callable, Literal
 from logging import Logger
 
 from younger.commons.constants import YoungerHandle
+from younger.commons.configure import get_config
 
 
 logging_level = dict(
@@ -37,6 +45,8 @@ logging_level = dict(
 
 logger_dict = dict()
 
+logger_listeners = dict()
+
 
 def naive_log(message: str, silence: bool = False):
     if silence:
@@ -62,19 +72,52 @@ def set_logger(
     mode: Literal['both', 'file', 'console'] = 'both',
     level: Literal['INFO', 'WARN', 'ERROR', 'DEBUG', 'FATAL', 'NOTSET'] = 'INFO',
     logging_filepath: pathlib.Path | str | None = None,
-    show_setting_log: bool = True
+    show_setting_log: bool = True,
+    asynchronous: bool = False,
+    style: Literal['text', 'json'] = 'text',
+    max_bytes: int = 0,
+    backup_count: int = 0,
+    rotate_when: str | None = None,
+    rate_limit: int | None = None,
+    rate_period: float = 1.0
 ):
+    r"""Sets up the logger 'name'.
+
+    If 'style' is 'json', every record is written as one JSON object per line (see :class:`JSONFormatter`).
+
+    The logging file is rotated when it reaches 'max_bytes' bytes (if 'max_bytes' > 0), or at the interval 'rotate_when' (e.g. 'midnight', 'H'; see :class:`logging.handlers.TimedRotatingFileHandler`),
+    keeping 'backup_count' old files. Only one process should write a rotated file, e.g. the listener of an asynchronous logger.
+
+    If 'rate_limit' is given, each call site (file and line) emits at most 'rate_limit' records every 'rate_period' seconds,
+    and the number of records suppressed meanwhile is reported on the next record emitted by that call site,
+    or, if the call site stays silent, by a summary record at the end of the period (see :class:`CallSiteRateLimitFilter`).
+
+    If 'asynchronous' is True, the logger only puts records into a queue, and a background listener thread formats and writes them,
+    so logging never blocks the caller on I/O. Queued records are flushed when the process exits, or by :func:`stop_logger_listener`.
+
+    Worker processes may log into the same file: the file is opened in append mode and every record is written by one write() call,
+    so records of different processes never interleave. Workers forked from a process with an asynchronous logger write synchronously
+    through the inherited handlers (a rotating file is appended to without being rotated by them), and spawned workers just call :func:`set_logger` with the same 'logging_filepath'.
+    """
     assert mode in {'both', 'file', 'console'}, f'Not Support The Logging Mode - \'{mode}\'.'
     assert level in {'INFO', 'WARN', 'ERROR', 'DEBUG', 'FATAL', 'NOTSET'}, f'Not Support The Logging Level - \'{level}\'.'
+    assert style in {'text', 'json'}, f'Not Support The Logging Style - \'{style}\'.'
+    assert max_bytes == 0 or rotate_when is None, f'Logging File Can Be Rotated Either By Size or By Time.'
 
     logging_filepath = pathlib.Path(logging_filepath) if isinstance(logging_filepath, str) else logging_filepath
 
-    logging_formatter = logging.Formatter("[%(asctime)s %(levelname)s] %(message)s")
+    logging_formatter = JSONFormatter() if style == 'json' else TextFormatter("[%(asctime)s %(levelname)s] %(message)s")
     logger = logging.getLogger(name)
     logger.setLevel(logging_level[level])
 
-    logger.handlers.clear()
+    for logging_filter in [logging_filter for logging_filter in logger.filters if isinstance(logging_filter, CallSiteRateLimitFilter)]:
+        logging_filter.flush()
+        logger.removeFilter(logging_filter)
+    stop_logger_listener(name)
+    if rate_limit is not None:
+        logger.addFilter(CallSiteRateLimitFilter(rate_limit, rate_period, report=logger.callHandlers))
 
+    handlers = list()
     if mode in {'both', 'file'}:
         if logging_filepath is None:
             logging_dirpath = pathlib.Path(os.getcwd())
@@ -87,31 +130,258 @@ def set_logger(
             logging_filepath = str(logging_filepath)
             naive_log(f'Logging file will be saved in the directory: \'{logging_dirpath}\', filename: \'{logging_filename}\'', silence=not show_setting_log)
 
-        file_handler = logging.FileHandler(logging_filepath, mode='a', encoding='utf-8')
+        if 0 < max_bytes:
+            file_handler = logging.handlers.RotatingFileHandler(logging_filepath, mode='a', maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+        elif rotate_when is not None:
+            file_handler = logging.handlers.TimedRotatingFileHandler(logging_filepath, when=rotate_when, backupCount=backup_count, encoding='utf-8')
+        else:
+            file_handler = logging.FileHandler(logging_filepath, mode='a', encoding='utf-8')
         file_handler.setLevel(logging_level[level])
         file_handler.setFormatter(logging_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
     if mode in {'both', 'console'}:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging_level[level])
         console_handler.setFormatter(logging_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    if asynchronous:
+        record_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(record_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        logger_listeners[name] = listener
+        handlers = [LocalQueueHandler(record_queue)]
+    # A fresh list, since this may run within 'logger.callHandlers' looping over the former one (see :class:`DefaultLoggerHandler`).
+    logger.handlers = handlers
 
     logger.propagate = False
     logger_dict[name] = logger
 
-    naive_log(f'Logger: \'{name}\' - \'{mode}\' - \'{level}\'', silence=not show_setting_log)
+    naive_log(f'Logger: \'{name}\' - \'{mode}\' - \'{level}\' - \'{style}\'' + (' - \'asynchronous\'' if asynchronous else ''), silence=not show_setting_log)
 
     return logger
 
 
+class TextFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        suppressed = getattr(record, 'suppressed', 0)
+        if suppressed:
+            message = f'{message} [{suppressed} Similar Messages Suppressed]'
+        return message
+
+
+class JSONFormatter(logging.Formatter):
+    r"""Formats each record as one line of JSON with the keys 'time', 'level', 'name', 'message', 'filename', 'lineno', 'process',
+    plus 'suppressed' (see :class:`CallSiteRateLimitFilter`) and 'exception' when relevant."""
+    def format(self, record: logging.LogRecord) -> str:
+        entry = dict(
+            time = self.formatTime(record),
+            level = record.levelname,
+            name = record.name,
+            message = record.getMessage(),
+            filename = record.filename,
+            lineno = record.lineno,
+            process = record.process,
+        )
+        suppressed = getattr(record, 'suppressed', 0)
+        if suppressed:
+            entry['suppressed'] = suppressed
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class CallSiteRateLimitFilter(logging.Filter):
+    r"""Lets each call site (file and line) emit at most 'rate_limit' records every 'rate_period' seconds.
+
+    The number of records dropped since the last emitted one is attached to the next emitted record of the same call site as 'record.suppressed'.
+    If no record of the call site is emitted by the end of the period, a summary record (the last dropped record, carrying the count) is passed to 'report' instead,
+    and :meth:`flush` reports every pending count at once, e.g. at shutdown.
+    """
+    def __init__(self, rate_limit: int, rate_period: float = 1.0, report: Callable[[logging.LogRecord], None] | None = None):
+        super().__init__()
+        assert 0 < rate_limit, f'Rate Limit Must Be Positive.'
+        self._rate_limit = rate_limit
+        self._rate_period = rate_period
+        self._report = report
+        self.reset()
+
+    def reset(self) -> None:
+        # Call Site -> [Period Start, Emitted, Suppressed, Last Suppressed Record, Report Timer]
+        self._call_sites = dict()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        call_site = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            state = self._call_sites.get(call_site, None)
+            if state is None or self._rate_period <= now - state[0]:
+                state = [now, 0, 0, None, None] if state is None else [now, 0, state[2], state[3], state[4]]
+                self._call_sites[call_site] = state
+            if self._rate_limit <= state[1]:
+                state[2] += 1
+                state[3] = record
+                if self._report is not None and state[4] is None:
+                    state[4] = threading.Timer(state[0] + self._rate_period - now, self._report_call_site, args=(call_site, False))
+                    state[4].daemon = True
+                    state[4].start()
+                return False
+            state[1] += 1
+            record.suppressed, state[2] = state[2], 0
+        return True
+
+    def _report_call_site(self, call_site: tuple[str, int], force: bool) -> None:
+        with self._lock:
+            state = self._call_sites[call_site]
+            state[4] = None
+            if state[2] == 0:
+                return
+            remaining = state[0] + self._rate_period - time.monotonic()
+            if not force and 0 < remaining:
+                # A new period began meanwhile, its count is reported at its end, unless a record of the call site is emitted before.
+                state[4] = threading.Timer(remaining, self._report_call_site, args=(call_site, False))
+                state[4].daemon = True
+                state[4].start()
+                return
+            summary = copy.copy(state[3])
+            summary.msg = summary.getMessage()
+            summary.args = None
+            summary.suppressed, state[2], state[3] = state[2], 0, None
+        self._report(summary)
+
+    def flush(self) -> None:
+        r"""Reports the pending counts of all call sites now."""
+        if self._report is None:
+            return
+        with self._lock:
+            call_sites = list(self._call_sites.keys())
+            for state in self._call_sites.values():
+                if state[4] is not None:
+                    state[4].cancel()
+        for call_site in call_sites:
+            self._report_call_site(call_site, True)
+
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    # The message is merged with its arguments on the caller's thread, since the arguments may be mutated before the listener formats the record,
+    # but the record is not formatted here: records never leave the process, and each handler of the listener applies its own formatter.
+    _exception_formatter_ = logging.Formatter()
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or self.__class__._exception_formatter_.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def stop_logger_listener(name: str) -> None:
+    listener = logger_listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+
+
+def get_rate_limit_filters() -> list[CallSiteRateLimitFilter]:
+    return [logging_filter for logger in logger_dict.values() for logging_filter in logger.filters if isinstance(logging_filter, CallSiteRateLimitFilter)]
+
+
+@atexit.register
+def stop_logger_listeners() -> None:
+    for logging_filter in get_rate_limit_filters():
+        logging_filter.flush()
+    for name in list(logger_listeners.keys()):
+        stop_logger_listener(name)
+
+
+def acquire_listener_handlers_before_fork() -> None:
+    # No listener thread may be in the middle of a write when forking, or the child would inherit a locked stream.
+    for listener in logger_listeners.values():
+        for handler in listener.handlers:
+            handler.acquire()
+
+
+def release_listener_handlers_after_fork() -> None:
+    for listener in logger_listeners.values():
+        for handler in listener.handlers:
+            handler.release()
+
+
+def get_appending_handler(handler: logging.Handler) -> logging.Handler:
+    # Only the parent may rotate its logging file, a child appends to whichever file is currently at the path, reopening it after each rotation.
+    if not isinstance(handler, (logging.handlers.RotatingFileHandler, logging.handlers.TimedRotatingFileHandler)):
+        return handler
+    appending_handler = logging.handlers.WatchedFileHandler(handler.baseFilename, mode='a', encoding=handler.encoding)
+    appending_handler.setLevel(handler.level)
+    appending_handler.setFormatter(handler.formatter)
+    return appending_handler
+
+
+def use_synchronous_handlers_after_fork() -> None:
+    # The listener threads are not inherited by a forked child, its asynchronous loggers write through (appending copies of) the listeners' handlers directly.
+    for name, listener in logger_listeners.items():
+        logger = logging.getLogger(name)
+        logger.handlers.clear()
+        for handler in listener.handlers:
+            logger.addHandler(get_appending_handler(handler))
+    logger_listeners.clear()
+    # Neither the report timers nor the locks held by other threads survive a fork.
+    for logging_filter in get_rate_limit_filters():
+        logging_filter.reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=acquire_listener_handlers_before_fork, after_in_parent=release_listener_handlers_after_fork, after_in_child=use_synchronous_handlers_after_fork)
+
+
 def use_logger(name: str):
     global logger
     logger = get_logger(name)
 
 
-set_logger(YoungerHandle.MainName, mode='console', level='INFO', show_setting_log=False)
+def set_default_logger() -> Logger:
+    r"""Sets up the default logger from the 'logging' section of the configuration (see :func:`younger.commons.configure.get_config`)."""
+    logging_config = get_config().logging
+    return set_logger(
+        YoungerHandle.MainName,
+        mode=logging_config.mode,
+        level=logging_config.level,
+        logging_filepath=logging_config.filepath,
+        show_setting_log=False,
+        asynchronous=logging_config.asynchronous,
+        style=logging_config.style,
+    )
+
+
+class DefaultLoggerHandler(logging.Handler):
+    r"""The only handler of the default logger until its first record, which sets the default logger up (see :func:`set_default_logger`) and is then handled by it.
+
+    So the configuration is read on first use and never when importing, and an explicit :func:`set_logger` before the first record replaces it untouched.
+    """
+    def emit(self, record: logging.LogRecord) -> None:
+        logger = logging.getLogger(record.name)
+        if self in logger.handlers:
+            logger = set_default_logger()
+        if logger.isEnabledFor(record.levelno):
+            logger.handle(record)
+
+
+def prepare_default_logger() -> Logger:
+    logger = logging.getLogger(YoungerHandle.MainName)
+    logger.setLevel(logging.DEBUG)
+    logger.handlers.clear()
+    logger.addHandler(DefaultLoggerHandler())
+    logger.propagate = False
+    logger_dict[YoungerHandle.MainName] = logger
+    return logger
+
+
+prepare_default_logger()
 
 use_logger(YoungerHandle.MainName)
 
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 16:31:54
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 16:31:54
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import os
+import json
+import math
+import bisect
+import pathlib
+import tempfile
+import threading
+
+from typing import Literal
+
+from younger.commons.configure import get_config
+
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, math.inf)
+
+THROUGHPUT_BUCKETS = tuple(float(1024 * 4 ** exponent) for exponent in range(11)) + (math.inf, ) # 1 KiB/s ~ 1 TiB/s
+
+
+class Counter(object):
+    def __init__(self, name: str, help: str = ''):
+        self.name = name
+        self.help = help
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def increase(self, value: int | float = 1) -> None:
+        with self._lock:
+            self.value += value
+
+    def to_dict(self) -> dict:
+        return dict(type='counter', help=self.help, value=self.value)
+
+    def to_prometheus(self) -> list[str]:
+        return [
+            f'# HELP {self.name} {self.help}',
+            f'# TYPE {self.name} counter',
+            f'{self.name} {self.value}',
+        ]
+
+
+class Histogram(object):
+    def __init__(self, name: str, help: str = '', buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        assert list(buckets) == sorted(buckets), f'The Buckets Of Histogram \'{name}\' Must Be Sorted.'
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets) if buckets[-1] == math.inf else tuple(buckets) + (math.inf, )
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: int | float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def to_dict(self) -> dict:
+        return dict(
+            type='histogram', help=self.help,
+            buckets=[[bucket if bucket != math.inf else '+Inf', count] for bucket, count in zip(self.buckets, self.counts)],
+            sum=self.sum, count=self.count
+        )
+
+    def to_prometheus(self) -> list[str]:
+        lines = [
+            f'# HELP {self.name} {self.help}',
+            f'# TYPE {self.name} histogram',
+        ]
+        cumulative_count = 0
+        for bucket, count in zip(self.buckets, self.counts):
+            cumulative_count += count
+            lines.append(f'{self.name}_bucket{{le="{"+Inf" if bucket == math.inf else bucket}"}} {cumulative_count}')
+        lines.append(f'{self.name}_sum {self.sum}')
+        lines.append(f'{self.name}_count {self.count}')
+        return lines
+
+
+class MetricsRegistry(object):
+    r"""A process-local set of named counters and histograms.
+
+    Metrics are created on their first use. Each process owns its own registry, so pool workers have to export their metrics themselves.
+    """
+    def __init__(self):
+        self._metrics: dict[str, Counter | Histogram] = dict()
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str = '') -> Counter:
+        metric = self._metrics.get(name, None)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.setdefault(name, Counter(name, help=help))
+        assert isinstance(metric, Counter), f'Metric \'{name}\' Is Not A Counter.'
+        return metric
+
+    def histogram(self, name: str, help: str = '', buckets: tuple[float, ...] = LATENCY_BUCKETS) -> Histogram:
+        metric = self._metrics.get(name, None)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.setdefault(name, Histogram(name, help=help, buckets=buckets))
+        assert isinstance(metric, Histogram), f'Metric \'{name}\' Is Not A Histogram.'
+        return metric
+
+    def clear(self) -> None:
+        with self._lock:
+            self._metrics.clear()
+
+    def to_dict(self) -> dict[str, dict]:
+        return {name: metric.to_dict() for name, metric in sorted(self._metrics.items())}
+
+    def to_prometheus(self) -> str:
+        lines = list()
+        for _, metric in sorted(self._metrics.items()):
+            lines.extend(metric.to_prometheus())
+        return '\n'.join(lines) + '\n'
+
+
+METRICS_ENABLED: bool | None = None # None - Read from the configuration on first use.
+
+METRICS_REGISTRY: MetricsRegistry = MetricsRegistry()
+
+
+def set_metrics_enabled(enabled: bool | None) -> None:
+    r"""Enables or disables metrics, None makes the next :func:`get_metrics_enabled` read the configuration again."""
+    assert enabled is None or isinstance(enabled, bool)
+    global METRICS_ENABLED
+    METRICS_ENABLED = enabled
+    return
+
+
+def get_metrics_enabled() -> bool:
+    global METRICS_ENABLED
+    if METRICS_ENABLED is None:
+        METRICS_ENABLED = get_config().metrics.enabled
+    return METRICS_ENABLED
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    return METRICS_REGISTRY
+
+
+def increase_counter(name: str, value: int | float = 1, help: str = '') -> None:
+    r"""Increases the counter 'name' by 'value', does nothing unless metrics are enabled (see :func:`set_metrics_enabled`)."""
+    if not (METRICS_ENABLED or METRICS_ENABLED is None and get_metrics_enabled()):
+        return
+    METRICS_REGISTRY.counter(name, help=help).increase(value)
+
+
+def observe_histogram(name: str, value: int | float, help: str = '', buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+    r"""Records 'value' into the histogram 'name', does nothing unless metrics are enabled (see :func:`set_metrics_enabled`)."""
+    if not (METRICS_ENABLED or METRICS_ENABLED is None and get_metrics_enabled()):
+        return
+    METRICS_REGISTRY.histogram(name, help=help, buckets=buckets).observe(value)
+
+
+def export_metrics(filepath: pathlib.Path | str, format: Literal['json', 'prometheus'] | None = None) -> None:
+    r"""Writes all metrics into 'filepath' atomically, as JSON or in the Prometheus text format (e.g. for the textfile collector of node_exporter).
+
+    If 'format' is None, it is 'prometheus' for the '.prom' suffix and 'json' otherwise.
+    """
+    filepath = pathlib.Path(filepath)
+    format = format or ('prometheus' if filepath.suffix == '.prom' else 'json')
+    assert format in {'json', 'prometheus'}, f'Not Support The Metrics Format - \'{format}\'.'
+
+    content = json.dumps(METRICS_REGISTRY.to_dict(), indent=2) if format == 'json' else METRICS_REGISTRY.to_prometheus()
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temp_filepath = tempfile.mkstemp(prefix=f'.{filepath.name}.', dir=filepath.parent)
+    with os.fdopen(descriptor, 'w') as file:
+        file.write(content)
+    os.chmod(temp_filepath, 0o644)
+    os.replace(temp_filepath, filepath)
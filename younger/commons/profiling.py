@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 16:02:37
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 16:02:37
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import os
+import sys
+import time
+import pstats
+import cProfile
+import pathlib
+import tracemalloc
+import contextlib
+
+from typing import Iterator, Literal, TextIO
+
+from younger.commons.io import create_dir, get_system_depend_path
+
+
+PROFILE_SORT_KEYS = ('cumulative', 'tottime', 'calls', 'ncalls', 'filename', 'name')
+
+
+def get_profiling_filepath(dirpath: pathlib.Path | str, name: str, suffix: str) -> pathlib.Path:
+    dirpath = get_system_depend_path(dirpath)
+    return dirpath.joinpath(f'{name}-{time.strftime("%Y%m%d-%H%M%S")}-{os.getpid()}{suffix}')
+
+
+def report_cpu_profile(profiler: cProfile.Profile, filepath: pathlib.Path, top: int = 30, sort_key: str = 'cumulative', stream: TextIO | None = None) -> None:
+    r"""Dumps the statistics of 'profiler' to 'filepath' (readable by :mod:`pstats`, snakeviz, ...) and prints the 'top' hotspots sorted by 'sort_key'."""
+    stream = stream or sys.stderr
+    profiler.dump_stats(filepath)
+    stream.write(f'\n=== CPU Profile (Top {top} By {sort_key}) - Saved Into \'{filepath}\' ===\n')
+    pstats.Stats(profiler, stream=stream).strip_dirs().sort_stats(sort_key).print_stats(top)
+
+
+def report_memory_trace(snapshot: tracemalloc.Snapshot, peak: int, filepath: pathlib.Path, top: int = 30, stream: TextIO | None = None) -> None:
+    r"""Dumps 'snapshot' to 'filepath' (readable by :meth:`tracemalloc.Snapshot.load`) and prints the 'top' allocation sites still alive at the end."""
+    stream = stream or sys.stderr
+    snapshot.dump(filepath)
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        tracemalloc.Filter(False, '<unknown>'),
+    ])
+    statistics = snapshot.statistics('lineno')
+    stream.write(f'\n=== Memory Trace (Top {top} Allocation Sites, Peak {peak / 1024 / 1024:.2f} MiB) - Saved Into \'{filepath}\' ===\n')
+    for statistic in statistics[:top]:
+        stream.write(f'{statistic}\n')
+    stream.write(f'Total Of Alive Allocations: {sum(statistic.size for statistic in statistics) / 1024 / 1024:.2f} MiB\n')
+
+
+@contextlib.contextmanager
+def profiling(
+    dirpath: pathlib.Path | str = '.',
+    name: str = 'younger',
+    cpu: bool = True,
+    memory: bool = False,
+    memory_frames: int = 1,
+    top: int = 30,
+    sort_key: Literal['cumulative', 'tottime', 'calls', 'ncalls', 'filename', 'name'] = 'cumulative',
+) -> Iterator[None]:
+    r"""Profiles the enclosed code with :mod:`cProfile` ('cpu') and/or :mod:`tracemalloc` ('memory').
+
+    On exit, even if the enclosed code raised, sorted summaries are printed to stderr and the raw results are dumped under 'dirpath':
+    '<name>-<time>-<pid>.prof' for the CPU profile and '<name>-<time>-<pid>.tracemalloc' for the memory snapshot.
+    Only the calling thread is profiled by cProfile, work done in other processes is not covered.
+
+    Args:
+        memory_frames (int): The number of frames stored per allocation traceback, more frames cost more overhead.
+        top (int): The number of entries printed in each summary.
+        sort_key (str): The key the CPU hotspots are sorted by.
+    """
+    assert sort_key in PROFILE_SORT_KEYS, f'Not Support The Sort Key - \'{sort_key}\'.'
+    if not (cpu or memory):
+        yield
+        return
+
+    dirpath = get_system_depend_path(dirpath)
+    create_dir(dirpath)
+
+    if memory:
+        tracemalloc.start(memory_frames)
+    if cpu:
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if cpu:
+            profiler.disable()
+        if memory:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        if cpu:
+            report_cpu_profile(profiler, get_profiling_filepath(dirpath, name, '.prof'), top=top, sort_key=sort_key)
+        if memory:
+            report_memory_trace(snapshot, peak, get_profiling_filepath(dirpath, name, '.tracemalloc'), top=top)
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- encoding=utf8 -*-
+
+########################################################################
+# Created time: 2026-10-19 10:12:31
+# Author: Jason Young (杨郑鑫).
+# E-Mail: AI.Jason.Young@outlook.com
+# Last Modified by: Jason Young (杨郑鑫)
+# Last Modified time: 2026-10-19 10:12:31
+# Copyright (c) 2026 Yangs.AI
+#
+# This source code is licensed under the Apache License 2.0 found in the
+# LICENSE file in the root directory of this source tree.
+########################################################################
+
+
+import os
+import json
+import stat
+import time
+import shutil
+import pathlib
+import tempfile
+import contextlib
+
+from typing import Iterator, Literal
+
+from younger.commons.io import create_dir, lock_file, get_system_depend_path
+from younger.commons.hash import hash_file
+from younger.commons.cache import get_cache_root
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+FICLONE = 0x40049409
+
+
+def reflink_file(src_filepath: pathlib.Path, dst_filepath: pathlib.Path) -> None:
+    r"""Creates 'dst_filepath' as a copy-on-write clone of 'src_filepath'.
+
+    Only supported on Linux filesystems with reflink support (Btrfs, XFS, ...), otherwise an OSError is raised.
+    """
+    if fcntl is None or not hasattr(fcntl, 'ioctl'):
+        raise OSError('Reflink Is Not Supported On This Platform.')
+    with open(src_filepath, 'rb') as src, open(dst_filepath, 'wb') as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError as exception:
+            dst.close()
+            os.remove(dst_filepath)
+            raise exception
+
+
+def link_file(src_filepath: pathlib.Path, dst_filepath: pathlib.Path, method: Literal['auto', 'reflink', 'hardlink', 'copy'] = 'auto') -> Literal['reflink', 'hardlink', 'copy']:
+    r"""Materializes 'src_filepath' at 'dst_filepath' without copying data whenever the filesystem allows it.
+
+    With method 'auto', a reflink is tried first (an independent copy-on-write file), then a hardlink, then a plain copy.
+    'dst_filepath' is replaced atomically, and the method actually used is returned.
+    """
+    assert method in {'auto', 'reflink', 'hardlink', 'copy'}, f'Not Support The Link Method - \'{method}\'.'
+    methods = ['reflink', 'hardlink', 'copy'] if method == 'auto' else [method]
+
+    create_dir(dst_filepath.parent)
+    temp_filepath = dst_filepath.with_name(f'.{dst_filepath.name}.{os.getpid()}.link')
+    temp_filepath.unlink(missing_ok=True)
+    for index, method in enumerate(methods, start=1):
+        try:
+            if method == 'reflink':
+                reflink_file(src_filepath, temp_filepath)
+            if method == 'hardlink':
+                os.link(src_filepath, temp_filepath)
+            if method == 'copy':
+                shutil.copyfile(src_filepath, temp_filepath)
+            break
+        except OSError as exception:
+            temp_filepath.unlink(missing_ok=True)
+            if index == len(methods):
+                raise exception
+
+    if method != 'hardlink':
+        os.chmod(temp_filepath, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)
+    os.replace(temp_filepath, dst_filepath)
+    return method
+
+
+class ArtifactStore(object):
+    r"""A local content-addressed store of artifacts, keyed by their digests.
+
+    Objects are stored read-only under 'objects/<digest[:2]>/<digest>' and are materialized into other places through reflinks or hardlinks (see :func:`link_file`).
+    Every materialized path is tracked as a reference of its object; unreferenced objects can be evicted under a byte budget, least recently used first.
+    The URL an object was downloaded from is also recorded, so that the same download anywhere on the machine can reuse it.
+
+    The index is a JSON file guarded by an inter-process file lock, so one store can be shared by all processes of a host.
+    """
+    _objects_dirname_ = 'objects'
+    _index_filename_ = 'index.json'
+    _lock_filename_ = 'lock'
+    def __init__(self, root_dirpath: pathlib.Path | str, hash_algorithm: str = 'SHA256'):
+        self._root_dirpath = get_system_depend_path(root_dirpath)
+        self._objects_dirpath = self._root_dirpath.joinpath(self.__class__._objects_dirname_)
+        self._index_filepath = self._root_dirpath.joinpath(self.__class__._index_filename_)
+        self._lock_filepath = self._root_dirpath.joinpath(self.__class__._lock_filename_)
+        self._hash_algorithm = hash_algorithm
+        create_dir(self._objects_dirpath)
+
+    @property
+    def root_dirpath(self) -> pathlib.Path:
+        return self._root_dirpath
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[dict]:
+        with lock_file(self._lock_filepath):
+            index = self._load_index()
+            yield index
+            self._save_index(index)
+
+    def _load_index(self) -> dict:
+        if self._index_filepath.is_file():
+            with open(self._index_filepath, 'r') as file:
+                index = json.load(file)
+        else:
+            index = dict(objects=dict(), urls=dict())
+        return index
+
+    def _save_index(self, index: dict) -> None:
+        descriptor, temp_filepath = tempfile.mkstemp(prefix='.index.', dir=self._root_dirpath)
+        with os.fdopen(descriptor, 'w') as file:
+            json.dump(index, file)
+        os.replace(temp_filepath, self._index_filepath)
+
+    def _is_alive(self, digest: str, path: str, method: str) -> bool:
+        try:
+            path_stat = os.stat(path)
+        except OSError:
+            return False
+        if method == 'hardlink':
+            return path_stat.st_ino == os.stat(self.get_object_filepath(digest)).st_ino
+        return True
+
+    def get_object_filepath(self, digest: str) -> pathlib.Path:
+        return self._objects_dirpath.joinpath(digest[:2], digest)
+
+    def has(self, digest: str) -> bool:
+        return self.get_object_filepath(digest).is_file()
+
+    def lookup(self, url: str) -> dict | None:
+        r"""Returns the record (digest, etag, last_modified, size) of the object downloaded from 'url', if it is still in the store."""
+        with lock_file(self._lock_filepath, shared=True):
+            index = self._load_index()
+        record = index['urls'].get(url, None)
+        if record is None or not self.has(record['digest']):
+            return None
+        return record
+
+    def ingest(self, filepath: pathlib.Path | str, url: str | None = None, etag: str | None = None, last_modified: str | None = None) -> str:
+        r"""Adds the file at 'filepath' to the store and tracks 'filepath' as a reference of it.
+
+        If an identical object already exists, 'filepath' is replaced by a link to it, so that identical files share their storage.
+
+        Returns:
+            str: The digest of the file.
+        """
+        filepath = get_system_depend_path(filepath).absolute()
+        digest = hash_file(filepath, hash_algorithm=self._hash_algorithm)
+        object_filepath = self.get_object_filepath(digest)
+        with self._transaction() as index:
+            if object_filepath.is_file():
+                method = link_file(object_filepath, filepath)
+            else:
+                create_dir(object_filepath.parent)
+                try:
+                    os.link(filepath, object_filepath)
+                    method = 'hardlink'
+                except OSError:
+                    link_file(filepath, object_filepath, method='copy')
+                    method = 'copy'
+                os.chmod(object_filepath, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+
+            record = index['objects'].setdefault(digest, dict(size=object_filepath.stat().st_size, last_access=0, refs=dict()))
+            record['last_access'] = time.time()
+            record['refs'][str(filepath)] = method
+            if url is not None:
+                index['urls'][url] = dict(digest=digest, etag=etag, last_modified=last_modified, size=record['size'])
+        return digest
+
+    def materialize(self, digest: str, filepath: pathlib.Path | str, method: Literal['auto', 'reflink', 'hardlink', 'copy'] = 'auto') -> pathlib.Path:
+        r"""Places the object 'digest' at 'filepath' and tracks 'filepath' as a reference of it."""
+        filepath = get_system_depend_path(filepath).absolute()
+        with self._transaction() as index:
+            assert digest in index['objects'] and self.has(digest), f'No Such Object In Store: \'{digest}\''
+            method = link_file(self.get_object_filepath(digest), filepath, method=method)
+            record = index['objects'][digest]
+            record['last_access'] = time.time()
+            record['refs'][str(filepath)] = method
+        return filepath
+
+    def release(self, filepath: pathlib.Path | str) -> None:
+        r"""Stops tracking 'filepath' as a reference, the file itself is left untouched."""
+        filepath = str(get_system_depend_path(filepath).absolute())
+        with self._transaction() as index:
+            for record in index['objects'].values():
+                record['refs'].pop(filepath, None)
+
+    def prune(self) -> int:
+        r"""Drops the references whose paths were removed or replaced. Returns the number of dropped references."""
+        number_of_dropped = 0
+        with self._transaction() as index:
+            for digest, record in index['objects'].items():
+                for path, method in list(record['refs'].items()):
+                    if not self._is_alive(digest, path, method):
+                        record['refs'].pop(path)
+                        number_of_dropped += 1
+        return number_of_dropped
+
+    def evict(self, max_bytes: int) -> list[str]:
+        r"""Removes unreferenced objects, least recently used first, until the store holds at most 'max_bytes' bytes.
+
+        Returns:
+            list[str]: The digests of the evicted objects.
+        """
+        self.prune()
+        evicted = list()
+        with self._transaction() as index:
+            total_size = sum(record['size'] for record in index['objects'].values())
+            unreferenced = sorted((record['last_access'], digest) for digest, record in index['objects'].items() if len(record['refs']) == 0)
+            for _, digest in unreferenced:
+                if total_size <= max_bytes:
+                    break
+                self.get_object_filepath(digest).unlink(missing_ok=True)
+                total_size -= index['objects'].pop(digest)['size']
+                evicted.append(digest)
+
+            evicted_set = set(evicted)
+            index['urls'] = {url: record for url, record in index['urls'].items() if record['digest'] not in evicted_set}
+        return evicted
+
+    def get_size(self) -> int:
+        with lock_file(self._lock_filepath, shared=True):
+            index = self._load_index()
+        return sum(record['size'] for record in index['objects'].values())
+
+
+def get_artifact_store() -> ArtifactStore:
+    r"""Returns the store shared by all downloads of this host, located under the cache root."""
+    return ArtifactStore(get_cache_root().joinpath('artifacts'))
@@ -6,31 +6,301 @@
 # Author: Jason Young (杨郑鑫).
 # E-Mail: AI.Jason.Young@outlook.com
 # Last Modified by: Jason Young (杨郑鑫)
-# Last Modified time: 2024-11-28 09:35:59
+# Last Modified time: 2026-10-19 18:12:40
 # Copyright (c) 2024 Yangs.AI
-# 
+#
 # This source code is licensed under the Apache License 2.0 found in the
 # LICENSE file in the root directory of this source tree.
 ########################################################################
 
 
-import semantic_release
+import re
+import bisect
+import functools
+
+from typing import Iterable, Iterator
+
+
+# The same grammar as 'semantic_release.Version.parse', so both accept exactly the same strings.
+SEMANTIC_VERSION_Regex = re.compile(
+    r'''
+    (?P<major>0|[1-9]\d*)
+    \.
+    (?P<minor>0|[1-9]\d*)
+    \.
+    (?P<patch>0|[1-9]\d*)
+    (?:-(?P<prerelease>(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?
+    (?:\+(?P<buildmetadata>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?
+    ''',
+    re.VERBOSE
+)
+
+SEMANTIC_PRERELEASE_Regex = re.compile(r'(?P<token>[a-zA-Z0-9-\.]+)\.(?P<revision>\d+)')
+
+SEMANTIC_COMPARATOR_Regex = re.compile(
+    r'''
+    (?P<operator>\^|~|>=|<=|>|<|==|=)?
+    \s*v?
+    (?P<version>
+        (?P<major>\d+|[xX*])(?:\.(?P<minor>\d+|[xX*]))?(?:\.(?P<patch>\d+|[xX*]))?
+        (?:-[0-9a-zA-Z-.]+)?(?:\+[0-9a-zA-Z-.]+)?
+    )
+    ''',
+    re.VERBOSE
+)
+
+
+class SemanticVersion(object):
+    r"""A parsed semantic version, ordered and compared the same way as 'semantic_release.Version'.
+
+    Build metadata is kept but, as in 'semantic_release', ignored by comparisons.
+    """
+    __slots__ = ('major', 'minor', 'patch', 'prerelease_token', 'prerelease_revision', 'build_metadata', 'key')
+    def __init__(self, major: int, minor: int, patch: int, prerelease_token: str = 'rc', prerelease_revision: int | None = None, build_metadata: str = ''):
+        self.major = major
+        self.minor = minor
+        self.patch = patch
+        self.prerelease_token = prerelease_token
+        self.prerelease_revision = prerelease_revision
+        self.build_metadata = build_metadata
+        # A release sorts after all of its prereleases, prerelease tokens are compared component-wise as strings.
+        if prerelease_revision is None:
+            self.key = (major, minor, patch, 1, (), 0)
+        else:
+            self.key = (major, minor, patch, 0, tuple(prerelease_token.split('.')), prerelease_revision)
+
+    @property
+    def is_prerelease(self) -> bool:
+        return self.prerelease_revision is not None
+
+    def __str__(self) -> str:
+        # Same as 'semantic_release.Version', which omits a prerelease of revision 0.
+        prerelease = f'-{self.prerelease_token}.{self.prerelease_revision}' if self.prerelease_revision else ''
+        build_metadata = f'+{self.build_metadata}' if self.build_metadata else ''
+        return f'{self.major}.{self.minor}.{self.patch}{prerelease}{build_metadata}'
+
+    def __repr__(self) -> str:
+        return f'SemanticVersion(\'{self}\')'
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __eq__(self, other: 'SemanticVersion') -> bool:
+        return isinstance(other, SemanticVersion) and self.key == other.key
+
+    def __lt__(self, other: 'SemanticVersion') -> bool:
+        return self.key < other.key
+
+    def __le__(self, other: 'SemanticVersion') -> bool:
+        return self.key <= other.key
+
+    def __gt__(self, other: 'SemanticVersion') -> bool:
+        return self.key > other.key
+
+    def __ge__(self, other: 'SemanticVersion') -> bool:
+        return self.key >= other.key
+
+
+@functools.lru_cache(maxsize=65536)
+def parse_semantic(version: str) -> SemanticVersion | None:
+    r"""Parses 'version' without importing 'semantic_release', returns None if it is not a valid version. Results are cached."""
+    if not isinstance(version, str):
+        return None
+    match = SEMANTIC_VERSION_Regex.fullmatch(version)
+    if match is None:
+        return None
+
+    prerelease = match.group('prerelease')
+    if prerelease:
+        prerelease_match = SEMANTIC_PRERELEASE_Regex.match(prerelease)
+        if prerelease_match is None:
+            return None
+        prerelease_token, prerelease_revision = prerelease_match.group('token'), int(prerelease_match.group('revision'))
+    else:
+        prerelease_token, prerelease_revision = 'rc', None
+
+    return SemanticVersion(
+        int(match.group('major')), int(match.group('minor')), int(match.group('patch')),
+        prerelease_token=prerelease_token, prerelease_revision=prerelease_revision,
+        build_metadata=match.group('buildmetadata') or '',
+    )
 
 
 def check_semantic(version: str) -> bool:
-    try:
-        semantic_release.Version.parse(version)
-        result = True
-    except Exception as exception:
-        result = False
-    return result
+    return isinstance(version, str) and parse_semantic(version) is not None
+
+
+def check_semantics(versions: Iterable[str]) -> list[bool]:
+    return [check_semantic(version) for version in versions]
 
 
-def str_to_sem(str_ver: str) -> semantic_release.Version:
+def str_to_sem(str_ver: str) -> 'semantic_release.Version':
+    import semantic_release
     sem_ver = semantic_release.Version.parse(version_str=str_ver)
     return sem_ver
 
 
-def sem_to_str(sem_ver: semantic_release.Version) -> str:
+def sem_to_str(sem_ver: 'semantic_release.Version') -> str:
     str_ver = str(sem_ver)
     return str_ver
+
+
+def get_lowest_key(major: int, minor: int, patch: int) -> tuple:
+    # Lower than the key of any version (prereleases included) of major.minor.patch.
+    return (major, minor, patch, 0, (), -1)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_requirement(requirement: str) -> tuple[tuple[tuple[tuple, bool] | None, tuple[tuple, bool] | None], ...]:
+    r"""Parses a version requirement into a disjunction of (lower bound, upper bound) pairs over version keys, each bound being (key, inclusive) or None.
+
+    Supported requirements (npm/Cargo style), comparators separated by ',' or spaces are conjunctive, and alternatives separated by '||' are disjunctive:
+        '^1.2.3' (>=1.2.3, <2.0.0), '^0.2.3' (>=0.2.3, <0.3.0), '~1.2.3' and '~1.2' (>=1.2.x, <1.3.0), '~1' (<2.0.0),
+        '>=1.2', '>1.2.3', '<2', '<=1.4', '=1.2.3', '1.2' (any 1.2.x), '1.x', '*'.
+    Upper bounds derived from partial versions and caret/tilde ranges exclude the prereleases of the bound itself (e.g. '^1.2' excludes '2.0.0-rc.1').
+    """
+    alternatives = list()
+    for alternative in requirement.split('||'):
+        lower, upper = None, None
+        for comparator in alternative.replace(',', ' ').split():
+            if comparator in {'*', 'x', 'X'}:
+                continue
+            match = SEMANTIC_COMPARATOR_Regex.fullmatch(comparator)
+            assert match is not None, f'Invalid Version Comparator - \'{comparator}\' In Requirement \'{requirement}\'.'
+            comparator_lower, comparator_upper = get_comparator_bounds(match)
+            if comparator_lower is not None and (lower is None or lower[0] < comparator_lower[0] or (lower[0] == comparator_lower[0] and not comparator_lower[1])):
+                lower = comparator_lower
+            if comparator_upper is not None and (upper is None or comparator_upper[0] < upper[0] or (upper[0] == comparator_upper[0] and not comparator_upper[1])):
+                upper = comparator_upper
+        alternatives.append((lower, upper))
+    return tuple(alternatives)
+
+
+def get_comparator_bounds(match: re.Match) -> tuple[tuple[tuple, bool] | None, tuple[tuple, bool] | None]:
+    operator = match.group('operator') or '='
+    parts = list()
+    for part in (match.group('major'), match.group('minor'), match.group('patch')):
+        if part is None or part in {'x', 'X', '*'}:
+            break
+        parts.append(int(part))
+
+    if len(parts) == 3:
+        version = parse_semantic(match.group('version'))
+        assert version is not None, f'Invalid Version - \'{match.group("version")}\'.'
+        lowest = version.key
+    else:
+        assert '-' not in match.group('version') and '+' not in match.group('version'), f'Partial Version Can Not Have Prerelease Or Build Metadata - \'{match.group("version")}\'.'
+        if len(parts) == 0:
+            return None, None
+        lowest = get_lowest_key(*(parts + [0, 0])[:3])
+
+    major, minor, patch = (parts + [0, 0])[:3]
+
+    if operator == '^':
+        if major != 0 or len(parts) == 1:
+            upper = get_lowest_key(major + 1, 0, 0)
+        elif minor != 0 or len(parts) == 2:
+            upper = get_lowest_key(0, minor + 1, 0)
+        else:
+            upper = get_lowest_key(0, 0, patch + 1)
+        return (lowest, True), (upper, False)
+    if operator == '~':
+        upper = get_lowest_key(major + 1, 0, 0) if len(parts) == 1 else get_lowest_key(major, minor + 1, 0)
+        return (lowest, True), (upper, False)
+
+    if len(parts) == 3:
+        if operator in {'=', '=='}:
+            return (lowest, True), (lowest, True)
+        if operator == '>=':
+            return (lowest, True), None
+        if operator == '>':
+            return (lowest, False), None
+        if operator == '<=':
+            return None, (lowest, True)
+        if operator == '<':
+            return None, (lowest, False)
+
+    # A partial version covers a range of versions, 'above' is the lowest version above that range.
+    above = get_lowest_key(major + 1, 0, 0) if len(parts) == 1 else get_lowest_key(major, minor + 1, 0)
+    if operator in {'=', '=='}:
+        return (lowest, True), (above, False)
+    if operator == '>=':
+        return (lowest, True), None
+    if operator == '>':
+        return (above, True), None
+    if operator == '<=':
+        return None, (above, False)
+    if operator == '<':
+        return None, (lowest, False)
+
+
+class VersionIndex(object):
+    r"""A sorted set of semantic versions, supporting bulk insertion and range queries by requirement (see :func:`parse_requirement`).
+
+    Versions are parsed once (see :func:`parse_semantic`) and kept sorted by their keys, so that a query costs two binary searches per alternative of the requirement.
+    Equal versions differing only in build metadata are all kept.
+    """
+    def __init__(self, versions: Iterable[str] = ()):
+        self._keys: list[tuple] = list()
+        self._versions: list[str] = list()
+        self.update(versions)
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._versions)
+
+    def __contains__(self, version: str) -> bool:
+        semantic_version = parse_semantic(version)
+        if semantic_version is None:
+            return False
+        index = bisect.bisect_left(self._keys, semantic_version.key)
+        return index < len(self._keys) and self._keys[index] == semantic_version.key
+
+    def add(self, version: str) -> bool:
+        r"""Inserts 'version', returns False (and inserts nothing) if it is not a valid version."""
+        semantic_version = parse_semantic(version)
+        if semantic_version is None:
+            return False
+        index = bisect.bisect_right(self._keys, semantic_version.key)
+        self._keys.insert(index, semantic_version.key)
+        self._versions.insert(index, version)
+        return True
+
+    def update(self, versions: Iterable[str]) -> list[str]:
+        r"""Inserts all valid 'versions' with one sort, and returns the invalid ones."""
+        invalid_versions = list()
+        entries = list(zip(self._keys, self._versions))
+        for version in versions:
+            semantic_version = parse_semantic(version)
+            if semantic_version is None:
+                invalid_versions.append(version)
+            else:
+                entries.append((semantic_version.key, version))
+        entries.sort(key=lambda entry: entry[0])
+        self._keys = [key for key, _ in entries]
+        self._versions = [version for _, version in entries]
+        return invalid_versions
+
+    def select(self, requirement: str = '*', include_prerelease: bool = False) -> list[str]:
+        r"""Returns the versions satisfying 'requirement', in ascending order. Prereleases are skipped unless 'include_prerelease'."""
+        indices = set()
+        for lower, upper in parse_requirement(requirement):
+            start = 0 if lower is None else (bisect.bisect_left if lower[1] else bisect.bisect_right)(self._keys, lower[0])
+            end = len(self._keys) if upper is None else (bisect.bisect_right if upper[1] else bisect.bisect_left)(self._keys, upper[0])
+            indices.update(range(start, end))
+        return [self._versions[index] for index in sorted(indices) if include_prerelease or self._keys[index][3] == 1]
+
+    def latest(self, requirement: str = '*', include_prerelease: bool = False) -> str | None:
+        r"""Returns the highest version satisfying 'requirement', or None if there is none. Prereleases are skipped unless 'include_prerelease'."""
+        latest_index = None
+        for lower, upper in parse_requirement(requirement):
+            start = 0 if lower is None else (bisect.bisect_left if lower[1] else bisect.bisect_right)(self._keys, lower[0])
+            end = len(self._keys) if upper is None else (bisect.bisect_right if upper[1] else bisect.bisect_left)(self._keys, upper[0])
+            for index in range(end - 1, start - 1, -1):
+                if include_prerelease or self._keys[index][3] == 1:
+                    if latest_index is None or latest_index < index:
+                        latest_index = index
+                    break
+        return None if latest_index is None else self._versions[latest_index]